@@ -20,9 +20,16 @@ AI_DATA_PATTERNS = [
     re.compile(r"commercial|profit|monetiz(?:e|ation)|revenue|subscription|enterprise", re.I),
 ]
 
+# 문장 분리/공백 정리/폴백 스니펫/캡션 패턴 (문서마다 반복 사용하므로 미리 컴파일)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.\?!])\s+")
+_WS_RE = re.compile(r"\s+")
+_FALLBACK_SNIPPET_RE = re.compile(r".{0,80}(training\s+data|dataset|scrap(?:e|ing)|pirat(?:ed|ing)|unauthorized).{0,180}", re.I | re.DOTALL)
+_CAPTION_RE = re.compile(r"([A-Z0-9][A-Z0-9 ,.&'\-]{2,}?)\s*,\s*(?:et\s+al\.)?\s*Plaintiff[s]?\s*,?\s*v\.?\s*([A-Z0-9][A-Z0-9 ,.&'\-]{2,}?)\s*,\s*(?:Defendant[s]?|\b)", re.I)
+_CAPTION_SIMPLE_RE = re.compile(r"([A-Z0-9][A-Za-z0-9 ,.&'\-]{2,})\s+v\.?\s+([A-Z0-9][A-Za-z0-9 ,.&'\-]{2,})", re.I)
+
 def _sentences(text: str) -> List[str]:
     # 너무 거친 문장 분리지만, 스니펫에서는 충분
-    parts = re.split(r"(?<=[\.\?!])\s+", text)
+    parts = _SENTENCE_SPLIT_RE.split(text)
     return [p.strip() for p in parts if p and len(p.strip()) > 10]
 
 def detect_causes(text: str) -> List[str]:
@@ -44,13 +51,14 @@ def extract_ai_training_snippet(text: str, max_len: int = 280) -> str:
             scored.append((score, s))
     if not scored:
         # fallback: 키워드만이라도 있는 구간 (re.DOTALL 추가하여 줄바꿈 대응)
-        m = re.search(r".{0,80}(training\s+data|dataset|scrap(?:e|ing)|pirat(?:ed|ing)|unauthorized).{0,180}", text, re.I | re.DOTALL)
+        m = _FALLBACK_SNIPPET_RE.search(text)
         if m:
-            sn = re.sub(r"\s+", " ", m.group(0)).strip()
+            sn = _WS_RE.sub(" ", m.group(0)).strip()
             return (sn[:max_len] + "…") if len(sn) > max_len else sn
         return ""
-    scored.sort(key=lambda x: x[0], reverse=True)
-    sn = re.sub(r"\s+", " ", scored[0][1]).strip()
+    # 최고 점수 문장 하나만 필요하므로 정렬 대신 max (동점이면 앞 문장 우선)
+    best = max(scored, key=lambda x: x[0])
+    sn = _WS_RE.sub(" ", best[1]).strip()
     return (sn[:max_len] + "…") if len(sn) > max_len else sn
 
 def extract_parties_from_caption(text: str) -> tuple[str, str]:
@@ -60,16 +68,16 @@ def extract_parties_from_caption(text: str) -> tuple[str, str]:
     
     # 1. 정교한 패턴: "PLAINTIFF_NAME, [et al.,] Plaintiff(s), v. DEFENDANT_NAME, [et al.,] Defendant(s)"
     # [A-Z0-9]로 시작하고 특수문자 포함 가능하도록 개선
-    m = re.search(r"([A-Z0-9][A-Z0-9 ,.&'\-]{2,}?)\s*,\s*(?:et\s+al\.)?\s*Plaintiff[s]?\s*,?\s*v\.?\s*([A-Z0-9][A-Z0-9 ,.&'\-]{2,}?)\s*,\s*(?:Defendant[s]?|\b)", cap, re.I)
+    m = _CAPTION_RE.search(cap)
     if m:
-        p = re.sub(r"\s+", " ", m.group(1)).strip(" ,")
-        d = re.sub(r"\s+", " ", m.group(2)).strip(" ,")
+        p = _WS_RE.sub(" ", m.group(1)).strip(" ,")
+        d = _WS_RE.sub(" ", m.group(2)).strip(" ,")
         # 법원 이름 등이 잡히는 것 방지 (보통 DISTRICT COURT 등)
         if "DISTRICT" not in p.upper() and "COURT" not in p.upper():
             return p, d
 
     # 2. 더 단순: "X v. Y" (대소문자 구분 없이 검색하되, 결과는 정리)
-    m2 = re.search(r"([A-Z0-9][A-Za-z0-9 ,.&'\-]{2,})\s+v\.?\s+([A-Z0-9][A-Za-z0-9 ,.&'\-]{2,})", cap, re.I)
+    m2 = _CAPTION_SIMPLE_RE.search(cap)
     if m2:
         p2 = m2.group(1).strip()
         d2 = m2.group(2).strip()
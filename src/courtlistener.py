@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import orjson
 import re
-import requests
+import threading
+import requests_cache
+from requests_cache import DO_NOT_CACHE
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlsplit
+from typing import Callable, Iterable, Iterator, List, Dict, Mapping, Optional, TypeVar
 from datetime import datetime, timezone, timedelta
 
-from .utils import debug_log
+from .utils import debug_enabled, debug_log
 from .pdf_text import extract_pdf_text
 from .complaint_parse import (
     detect_causes,
@@ -22,6 +34,77 @@ SEARCH_URL = BASE + "/api/rest/v4/search/"
 DOCKET_URL = BASE + "/api/rest/v4/dockets/{id}/"
 DOCKETS_LIST_URL = BASE + "/api/rest/v4/dockets/"
 RECAP_DOCS_URL = BASE + "/api/rest/v4/recap-documents/"
+COURTS_URL = BASE + "/api/rest/v4/courts/"
+
+# =====================================================
+# 영속 HTTP 캐시 (실행 간 재사용)
+# 도켓/법원 정보는 하루에 한 번 정도만 바뀌므로 엔드포인트별 TTL로 재요청을 줄인다
+# =====================================================
+CACHE_DIR = os.getenv("CL_CACHE_DIR", ".cache")
+COURT_CACHE_PATH = os.path.join(CACHE_DIR, "cl_courts.json")
+
+
+def _http_cache_name() -> str:
+    """토큰별로 캐시 DB를 분리한다.
+    requests-cache는 Authorization 헤더를 캐시 키에서 제외하므로(토큰을 캐시에 남기지 않기 위함)
+    match_headers로는 구분되지 않는다 → 토큰 해시 앞부분을 DB 이름에 붙인다."""
+    token = os.getenv("COURTLISTENER_TOKEN", "").strip()
+    if not token:
+        return "cl_http"
+    return "cl_http_" + hashlib.sha1(token.encode("utf-8")).hexdigest()[:8]
+
+
+# CourtListener로 나가는 모든 요청(API/HEAD/도켓 HTML)은 이 세션 하나를 공유한다
+_SESSION = requests_cache.CachedSession(
+    os.path.join(CACHE_DIR, _http_cache_name()),
+    backend="sqlite",
+    expire_after=3600,
+    urls_expire_after={
+        COURTS_URL: 7 * 24 * 3600,
+        DOCKETS_LIST_URL: 3600,
+        SEARCH_URL: 300,
+        RECAP_DOCS_URL: 1800,
+    },
+)
+
+# CI 캐시는 실행마다 새 키로 저장되고 prefix로 복원되므로, 만료된 응답은 실행 시작 시 한 번 지워 DB가 계속 커지지 않게 한다
+try:
+    _SESSION.cache.delete(expired=True)
+except Exception as e:
+    debug_log("HTTP cache cleanup failed: %s", e)
+
+# 도켓 단위 fan-out 시 동시에 실행할 최대 스레드 수
+MAX_WORKERS = int(os.getenv("CL_FETCH_THREADS", "16"))
+
+# CourtListener 동시 요청 상한: fan-out 스레드가 많아도 429(Too Many Requests)를 피하도록 제한
+CL_CONCURRENCY = int(os.getenv("CL_CONCURRENCY", "12"))
+_cl_slots = threading.BoundedSemaphore(CL_CONCURRENCY)
+
+# 동일 URL/파라미터로 동시에 들어온 GET은 한 번만 보내고 결과를 공유 (in-flight coalescing)
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+# 429/5xx 응답 시 재시도 (Retry-After 헤더 우선, 없으면 지수 백오프)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+
+# 커넥션 풀 재사용: 호출마다 TCP+TLS 핸드셰이크를 새로 하지 않도록 세션에 어댑터를 고정
+# (fan-out 스레드 수보다 pool_maxsize가 커야 커넥션이 버려지지 않는다)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=max(32, MAX_WORKERS),
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            # 마지막 시도까지 실패하면 예외 대신 응답을 그대로 돌려 아래에서 로그를 남긴다
+            raise_on_status=False,
+        ),
+    ),
+)
 
 COMPLAINT_KEYWORDS = [
     "complaint",
@@ -29,12 +112,33 @@ COMPLAINT_KEYWORDS = [
     "petition",
     "class action complaint",
 ]
+# 검색 hit의 docket 필드(URL)에서 도켓 ID 추출
+_DOCKET_URL_RE = re.compile(r"/dockets/(\d+)/")
+
+# 서버 측 description__icontains 필터 용어: 위 키워드는 모두 이 둘 중 하나를 포함한다
+_COMPLAINT_FILTER_TERMS = ("complaint", "petition")
+# 설명(description) 1회 스캔으로 소장 여부 판정 (대소문자 무시이므로 .lower() 불필요)
+_COMPLAINT_RE = re.compile("|".join(map(re.escape, COMPLAINT_KEYWORDS)), re.IGNORECASE)
+
+# 소장 유형 판정: 우선순위 순서 (먼저 나온 유형이 이김)
+_COMPLAINT_TYPE_RE = re.compile(
+    r"(?P<second>second amended)|(?P<third>third amended)|(?P<amended>amended)"
+    r"|(?P<class_action>class action)|(?P<petition>petition)",
+    re.IGNORECASE,
+)
+_COMPLAINT_TYPES = (
+    ("second", "Second Amended"),
+    ("third", "Third Amended"),
+    ("amended", "Amended"),
+    ("class_action", "Class Action"),
+    ("petition", "Petition"),
+)
 
 # =====================================================
 # Dataclasses
 # =====================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CLDocument:
     docket_id: Optional[int]
     docket_number: str
@@ -53,7 +157,7 @@ class CLDocument:
     extracted_ai_snippet: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CLCaseSummary:
     docket_id: int
     case_name: str
@@ -78,24 +182,57 @@ class CLCaseSummary:
 # =====================================================
 
 def _safe_str(x) -> str:
-    return str(x).strip() if x is not None else ""
+    # API 응답 필드는 대부분 이미 str이므로 str() 변환을 건너뛴다
+    if type(x) is str:
+        return x.strip()
+    return "" if x is None else str(x).strip()
+
+def _cutoff_iso(days: int) -> str:
+    """오늘(UTC) 기준 days일 전 날짜를 YYYY-MM-DD 문자열로 반환 (문자열 비교용)"""
+    return (datetime.now(timezone.utc).date() - timedelta(days=days)).isoformat()
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def _before_cutoff(date_val: str, cutoff: str) -> bool:
+    """
+    YYYY-MM-DD 형식일 때만 cutoff와 문자열로 비교한다.
+    형식이 다르면(파싱 불가) 예전 동작처럼 걸러내지 않는다.
+    """
+    if not date_val:
+        return False
+    if not _ISO_DATE_RE.match(date_val):
+        debug_log("date parse error: %r", date_val)
+        return False
+    return date_val[:10] < cutoff
 
 def _detect_complaint_type(desc: str) -> str:
-    d = desc.lower()
-    if "second amended" in d:
-        return "Second Amended"
-    if "third amended" in d:
-        return "Third Amended"
-    if "amended" in d:
-        return "Amended"
-    if "class action" in d:
-        return "Class Action"
-    if "petition" in d:
-        return "Petition"
+    found = {m.lastgroup for m in _COMPLAINT_TYPE_RE.finditer(desc)}
+    for group, label in _COMPLAINT_TYPES:
+        if group in found:
+            return label
     return "Original"
 
 
-_court_cache = {}
+def _load_court_cache() -> Dict[str, str]:
+    try:
+        with open(COURT_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f) or {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_court_cache() -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(COURT_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(_court_cache, f, ensure_ascii=False)
+    except OSError as e:
+        debug_log("court cache save failed: %s", e)
+
+
+# court API URL → short_name (디스크에 저장하여 다음 실행에서도 재사용)
+_court_cache = _load_court_cache()
+_court_cache_lock = threading.Lock()
 
 def _build_court_meta(court_raw: str) -> tuple[str, str]:
     court_raw = _safe_str(court_raw)
@@ -109,7 +246,7 @@ def _build_court_meta(court_raw: str) -> tuple[str, str]:
         court_api_url = BASE + court_raw
     else:
         # fallback (legacy slug)
-        court_api_url = f"{BASE}/api/rest/v4/courts/{court_raw}/"
+        court_api_url = f"{COURTS_URL}{court_raw}/"
 
     if court_api_url in _court_cache:
         return _court_cache[court_api_url], court_api_url
@@ -117,14 +254,18 @@ def _build_court_meta(court_raw: str) -> tuple[str, str]:
     data = _get(court_api_url)
     if data and data.get("short_name"):
         short_name = data.get("short_name")
-        _court_cache[court_api_url] = short_name
+        with _court_cache_lock:
+            _court_cache[court_api_url] = short_name
+            _save_court_cache()
         return short_name, court_api_url
 
     # fallback
     return court_raw, court_api_url
 
 
-def _headers() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def _headers() -> Mapping[str, str]:
+    """요청 헤더는 실행 중 바뀌지 않으므로 한 번만 만들고 읽기 전용으로 공유한다."""
     token = os.getenv("COURTLISTENER_TOKEN", "").strip()
     headers = {
         "Accept": "application/json",
@@ -132,34 +273,264 @@ def _headers() -> Dict[str, str]:
     }
     if token:
         headers["Authorization"] = f"Token {token}"
-    return headers
+    return MappingProxyType(headers)
 
 
 def _get(url: str, params: Optional[dict] = None) -> Optional[dict]:
+    key = (url, tuple(sorted((k, str(v)) for k, v in params.items())) if params else ())
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        if pending is None:
+            fut: Future = Future()
+            _inflight[key] = fut
+    if pending is not None:
+        debug_log("COALESCED GET %s", url)
+        return pending.result()
+
+    result: Optional[dict] = None
+    try:
+        result = _get_uncoalesced(url, params)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        # 실패해도 대기 중인 스레드가 멈추지 않도록 항상 결과를 채운다
+        fut.set_result(result)
+
+
+def _get_uncoalesced(url: str, params: Optional[dict] = None) -> Optional[dict]:
     try:
-        debug_log(f"GET {url}")
-        debug_log(f"PARAMS length={len(str(params)) if params else 0}")
+        # 요청마다 호출되는 경로이므로 DEBUG가 꺼져 있으면 메세지 포맷 비용을 내지 않는다
+        debug_log("GET %s", url)
+        if debug_enabled():
+            debug_log("PARAMS length=%d", len(str(params)) if params else 0)
 
         # 🔥 FIX: CourtListener search는 반드시 GET 사용
-        r = requests.get(url, params=params, headers=_headers(), timeout=30)
+        # 429/5xx 재시도는 세션 어댑터(Retry)가 처리
+        with _cl_slots:
+            r = _SESSION.get(url, params=params, headers=_headers(), timeout=30)
 
         if r.status_code in (401, 403):
-            debug_log(f"AUTH ERROR {r.status_code} for {url}")           
+            debug_log("AUTH ERROR %s for %s", r.status_code, url)
             return None
 
         if r.status_code >= 400:
-            debug_log(f"HTTP ERROR {r.status_code}")
-            debug_log(f"RESPONSE TEXT: {r.text[:500]}")
+            debug_log("HTTP ERROR %s", r.status_code)
+            if debug_enabled():
+                debug_log("RESPONSE TEXT: %s", r.text[:500])
             return None
 
         r.raise_for_status()
-        debug_log(f"SUCCESS {url} status={r.status_code}")
-        return r.json()
+        debug_log("SUCCESS %s status=%s", url, r.status_code)
+        # 204 등 빈 본문은 파싱 예외로 흘려보내지 않고 바로 None
+        if not r.content:
+            return None
+        # RECAP 페이지는 수십 KB 단위이므로 stdlib json 대신 orjson으로 파싱
+        return orjson.loads(r.content)
     except Exception as e:
-        debug_log(f"EXCEPTION in _get function: {type(e).__name__}: {e}")    
+        debug_log("EXCEPTION in _get function: %s: %s", type(e).__name__, e)
+        return None
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _fan_out(fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """
+    items 각각에 fn을 스레드 풀로 병렬 적용하고, 입력 순서대로 결과를 반환한다.
+    (CourtListener 호출은 I/O 대기 위주이므로 스레드로 충분히 겹쳐진다)
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(x) for x in items]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as ex:
+        return list(ex.map(fn, items))
+
+
+# 다음 페이지 선행 요청 전용 풀 (_get만 실행하는 leaf 작업이라 중첩 대기로 막히지 않는다)
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="cl-prefetch")
+
+
+class _FilterRejected(Exception):
+    """서버가 description 필터 쿼리를 거부한 경우 (전체 조회로 폴백)"""
+
+
+class _NotCached(Exception):
+    """lru_cache 함수가 실패/빈 결과를 캐시에 남기지 않도록 던지는 예외 (래퍼에서 기본값으로 변환)"""
+
+
+# 페이지 번호 방식 응답이면 나머지 페이지를 한꺼번에 요청할 최대 페이지 (그 뒤는 next 순회)
+RECAP_PAGE_SIZE = 100
+RECAP_MAX_PARALLEL_PAGES = 100
+
+
+def _is_page_numbered(data: dict) -> bool:
+    """응답이 count(정수) + ?page=N 방식인지 (v4 cursor 방식이면 False)"""
+    next_url = data.get("next")
+    if not next_url or not isinstance(data.get("count"), int):
+        return False
+    return parse_qs(urlsplit(next_url).query).get("page") == ["2"]
+
+
+def _iter_recap_pages(docket_id: int, description: Optional[str] = None, eager: bool = False) -> Iterator[List[dict]]:
+    """
+    도켓의 RECAP 문서를 페이지 단위로 yield 한다.
+    페이지 요청이 실패하면 잘린 목록이 캐시되지 않도록 _NotCached를 던진다.
+    호출 측이 N 페이지를 필터링하는 동안 N+1 페이지를 미리 받아 둔다.
+    eager(호출 측이 끝까지 읽음)이고 첫 응답이 페이지 번호 방식이면,
+    count로 전체 페이지 수를 계산해 나머지를 동시에 요청한다.
+    (중간에 멈출 수 있는 호출 측은 eager=False로 한 페이지씩만 앞서 받아 불필요한 요청을 막는다)
+    description이 주어지면 서버에서 description__icontains로 먼저 거른다.
+    """
+    params = {"docket": docket_id, "page_size": RECAP_PAGE_SIZE}
+    if description:
+        params["description__icontains"] = description
+
+    data = _get(RECAP_DOCS_URL, params)
+    if not data:
+        if description:
+            raise _FilterRejected(description)
+        debug_log("RECAP pagination returned no data")
+        raise _NotCached(docket_id)
+    # django-filter는 모르는 필터를 조용히 무시한다 → 용어가 없는 문서가 섞여 오면 필터 미지원으로 간주
+    if description and any(
+        description not in _safe_str(d.get("description")).lower() for d in data.get("results", [])
+    ):
+        raise _FilterRejected(description)
+
+    # 첫 페이지가 이미 yield 되었는지 (페이지 번호 방식 병렬 구간)
+    yielded = eager and _is_page_numbered(data)
+    if yielded:
+        total_pages = min(-(-data["count"] // RECAP_PAGE_SIZE), RECAP_MAX_PARALLEL_PAGES)
+        windows = [
+            _PREFETCH_POOL.submit(_get, RECAP_DOCS_URL, {**params, "page": p})
+            for p in range(2, total_pages + 1)
+        ]
+        debug_log("RECAP docket=%s count=%s → %s pages in parallel", docket_id, data['count'], len(windows))
+        try:
+            yield data.get("results", [])
+            for window in windows:
+                data = window.result()
+                if not data:
+                    debug_log("RECAP pagination returned no data")
+                    raise _NotCached(docket_id)
+                yield data.get("results", [])
+        finally:
+            # 예외/조기 종료(GeneratorExit) 시 아직 시작되지 않은 페이지 요청은 취소
+            for window in windows:
+                window.cancel()
+
+    # cursor(next) 방식이거나 병렬 상한을 넘긴 나머지: 한 페이지씩 앞서 받아 둔다
+    next_url = data.get("next")
+    pending = _PREFETCH_POOL.submit(_get, next_url) if next_url else None
+    if not yielded:
+        yield data.get("results", [])
+    while pending is not None:
+        data = pending.result()
+        if not data:
+            debug_log("RECAP pagination returned no data")
+            raise _NotCached(docket_id)
+        next_url = data.get("next")
+        pending = _PREFETCH_POOL.submit(_get, next_url) if next_url else None
+        yield data.get("results", [])
+
+
+def _docket_order(d: dict) -> tuple:
+    """도켓 목록상의 위치: 문서 번호 → 첨부 번호 → id 순 (번호가 없으면 뒤로)"""
+    num = _safe_str(d.get("document_number"))
+    return (int(num) if num.isdigit() else float("inf"), d.get("attachment_number") or 0, d.get("id") or 0)
+
+
+def _iter_complaint_recap_pages(docket_id: int, eager: bool = False) -> Iterator[List[dict]]:
+    """
+    소장 후보 RECAP 문서만 서버에서 걸러 받아 페이지 단위로 yield 한다.
+    (수백 건짜리 도켓에서 전송량/페이지 수를 크게 줄임)
+    용어별 결과는 합친 뒤 도켓 순서(문서 번호)로 정렬해 한 번에 yield 한다:
+    용어 순서대로 이어 붙이면 뒤에 등재된 "complaint"가 앞선 "Petition"보다 먼저 나오기 때문.
+    필터가 거부되면 전체 목록 조회로 폴백하며, 호출 측의 _COMPLAINT_RE 검사는 그대로 유지한다.
+    """
+    found: Dict[object, dict] = {}
+    try:
+        for term in _COMPLAINT_FILTER_TERMS:
+            for page in _iter_recap_pages(docket_id, description=term, eager=eager):
+                for d in page:
+                    key = d.get("id")
+                    found.setdefault(key if key is not None else id(d), d)
+    except _FilterRejected as e:
+        debug_log("description filter rejected (%s) → full RECAP scan", e)
+        yield from _iter_recap_pages(docket_id, eager=eager)
+        return
+    yield sorted(found.values(), key=_docket_order)
+
+
+# 끝까지 순회한 도켓의 소장 후보 RECAP 문서 (요약/문서 빌더가 공유)
+_recap_docs_cache: Dict[int, tuple] = {}
+
+
+def _iter_recap_docs(docket_id: int, eager: bool = False) -> Iterator[dict]:
+    """
+    도켓의 소장 후보 RECAP 문서를 하나씩 yield 한다.
+    호출 측이 중간에 멈추면 남은 페이지는 요청하지 않고, 끝까지 돈 경우에만 결과를 캐시한다.
+    끝까지 읽을 호출 측만 eager=True로 페이지 병렬 요청을 켠다.
+    """
+    cached = _recap_docs_cache.get(docket_id)
+    if cached is not None:
+        yield from cached
+        return
+    docs: List[dict] = []
+    try:
+        for page in _iter_complaint_recap_pages(docket_id, eager=eager):
+            docs.extend(page)
+            yield from page
+    except _NotCached:
+        # 중간 페이지 실패: 받은 만큼만 돌려주고 캐시하지 않아 다른 빌더가 다시 조회하게 한다
+        debug_log("RECAP walk incomplete for docket=%s (not cached)", docket_id)
+        return
+    _recap_docs_cache[docket_id] = tuple(docs)
+
+
+# 도켓에 RECAP 문서가 하나라도 있는지 (조회 성공한 결과만 기억)
+_recap_presence: Dict[int, bool] = {}
+
+
+def _docket_has_recap_docs(docket_id: int) -> bool:
+    """필터 없이 page_size=1로 도켓의 RECAP 문서 존재 여부만 확인한다. 조회 실패는 False."""
+    cached = _recap_presence.get(docket_id)
+    if cached is not None:
+        return cached
+    data = _get(RECAP_DOCS_URL, {"docket": docket_id, "page_size": 1})
+    if data is None:
+        return False
+    present = bool(data.get("results")) or bool(data.get("count"))
+    _recap_presence[docket_id] = present
+    return present
+
+
+def _fetch_recap_docs(docket_id: int) -> tuple:
+    """도켓의 소장 후보 RECAP 문서 전체 (변경 불가한 tuple)"""
+    return tuple(_iter_recap_docs(docket_id, eager=True))
+
+
+def _first_complaint_doc(docket_id: int) -> Optional[dict]:
+    # 찾은 소장만 캐시한다: 못 찾은 경우(조회 실패 포함)는 다음 호출에서 다시 확인
+    # (끝까지 돈 목록은 _recap_docs_cache에 있으므로 재확인에 추가 요청은 없다)
+    try:
+        return _first_complaint_doc_cached(docket_id)
+    except _NotCached:
         return None
 
 
+@lru_cache(maxsize=None)
+def _first_complaint_doc_cached(docket_id: int) -> dict:
+    # 첫 소장을 찾는 즉시 멈춰 뒤쪽 페이지 요청을 건너뛴다
+    for d in _iter_recap_docs(docket_id):
+        debug_log("checking RECAP doc: %s", d.get("description"))
+        if _COMPLAINT_RE.search(_safe_str(d.get("description"))):
+            return d
+    raise _NotCached(docket_id)
+
+
 def _abs_url(u: str) -> str:
     if not u: return ""
     if u.startswith("http"): return u
@@ -173,57 +544,89 @@ def _abs_url(u: str) -> str:
 # NEW: PDF HEAD Validation (403 사전 감지)
 # =====================================================
 
-def _validate_pdf_url(pdf_url: str) -> bool:
+def _validate_pdf_url(pdf_url: str) -> Optional[Mapping[str, str]]:
     """
     PDF 다운로드 전에 HEAD 요청으로 사전 검증
+    성공하면 HEAD 응답 헤더를 돌려준다 (extract_pdf_text의 디스크 캐시 지문에 재사용), 실패하면 None.
     """
     if not pdf_url:
-        return False
+        return None
 
     try:
-        debug_log(f"HEAD check: {pdf_url}")
-
-        r = requests.head(
-            pdf_url,
-            headers={
-                "User-Agent": "Mozilla/5.0",
-                "Accept": "application/pdf",
-            },
-            timeout=15,
-            allow_redirects=True,
-        )
+        debug_log("HEAD check: %s", pdf_url)
+
+        with _cl_slots:
+            r = _SESSION.head(
+                pdf_url,
+                headers={
+                    "User-Agent": "Mozilla/5.0",
+                    "Accept": "application/pdf",
+                },
+                timeout=15,
+                allow_redirects=True,
+            )
 
-        debug_log(f"HEAD status={r.status_code}")
+        debug_log("HEAD status=%s", r.status_code)
 
         if r.status_code != 200:
-            debug_log(f"[ERROR] PDF HEAD failed status={r.status_code}")
-            return False
+            debug_log("[ERROR] PDF HEAD failed status=%s", r.status_code)
+            return None
 
         content_type = r.headers.get("Content-Type", "")
         content_length = r.headers.get("Content-Length", "unknown")
 
-        debug_log(f"Content-Type={content_type}")
-        debug_log(f"Content-Length={content_length}")
+        debug_log("Content-Type=%s", content_type)
+        debug_log("Content-Length=%s", content_length)
 
         if "pdf" not in content_type.lower():
             debug_log("[ERROR] HEAD response is not PDF")
-            return False
+            return None
 
-        return True
+        return r.headers
 
     except Exception as e:
-        debug_log(f"[ERROR] HEAD request exception: {type(e).__name__}: {e}")
-        return False
+        debug_log("[ERROR] HEAD request exception: %s: %s", type(e).__name__, e)
+        return None
 
 
 # =====================================================
 # NEW: HTML Parsing for PDF (No API Required)
 # =====================================================
 
+# 도켓 HTML의 PDF 링크: 절대 URL(storage) 또는 상대 URL(href="/recap/...")
+_PDF_LINK_RE = re.compile(
+    r"(?P<abs>https://storage\.courtlistener\.com/recap/[^\"]+?\.pdf)"
+    r'|href="(?P<rel>/recap/[^"]+?\.pdf)"',
+    re.IGNORECASE,
+)
+
+
+# 도켓 HTML 스트리밍 스캔 설정: 첫 PDF 링크는 대개 앞쪽 수십 KB 안에 있다
+HTML_CHUNK_SIZE = 32 * 1024
+HTML_SCAN_LIMIT = 512 * 1024
+HTML_SCAN_OVERLAP = 2048
+
+
 def _extract_first_pdf_from_docket_html(docket_id: int) -> str:
     """
     Fetch docket HTML page and extract the first PDF link.
     """
+    # 찾은 링크만 캐시한다: 일시적 실패("")는 다음 호출에서 다시 시도
+    try:
+        return _extract_first_pdf_from_docket_html_cached(docket_id)
+    except _NotCached:
+        return ""
+
+
+@lru_cache(maxsize=512)
+def _extract_first_pdf_from_docket_html_cached(docket_id: int) -> str:
+    pdf_url = _scan_docket_html_for_pdf(docket_id)
+    if not pdf_url:
+        raise _NotCached(docket_id)
+    return pdf_url
+
+
+def _scan_docket_html_for_pdf(docket_id: int) -> str:
     try:
         # 🔥 1. 먼저 API에서 정확한 도켓 URL(slug 포함)을 얻는다
         docket_meta = _get(DOCKET_URL.format(id=docket_id))
@@ -247,35 +650,47 @@ def _extract_first_pdf_from_docket_html(docket_id: int) -> str:
             "Connection": "keep-alive",
         }
 
-        r = requests.get(url, headers=headers, timeout=25, allow_redirects=True)
-        if r.status_code != 200:
-            return ""
-
-        html = r.text
-        debug_log(f"HTML fetch successful: {url}")
-        debug_log(f"HTML length: {len(html)}")
-        
-        # =====================================================
-        # 🔥 FIX: 절대 URL + 상대 URL 모두 탐지
-        # =====================================================
-
-        # 1️⃣ 절대 URL 먼저 탐지
-        match = re.search(
-            r"https://storage\.courtlistener\.com/recap/[^\"]+?\.pdf",
-            html,
-            re.IGNORECASE,
-        )
-        if match:
-            return match.group(0)
-
-        # 2️⃣ 상대 URL 탐지 (/recap/...)
-        match = re.search(
-            r'href="(/recap/[^"]+?\.pdf)"',
-            html,
-            re.IGNORECASE,
-        )
-        if match:
-            return STORAGE_BASE + match.group(1)
+        # HTML 전체(수 MB)를 받지 않고 조각 단위로 읽으며 링크를 찾는다 (스트리밍은 캐시하지 않음)
+        with _cl_slots:
+            r = _SESSION.get(
+                url, headers=headers, timeout=25, allow_redirects=True,
+                stream=True, expire_after=DO_NOT_CACHE,
+            )
+            try:
+                if r.status_code != 200:
+                    return ""
+                debug_log("HTML fetch successful: %s", url)
+                r.encoding = r.encoding or "utf-8"
+
+                # =====================================================
+                # 🔥 FIX: 절대 URL + 상대 URL 모두 탐지
+                # =====================================================
+
+                # 절대 URL을 상대 URL보다 우선한다: 절대 URL은 보이는 즉시 반환,
+                # 상대 URL은 첫 번째만 기억해 두고 상한까지 계속 읽는다
+                buf = ""
+                scanned = 0
+                first_rel = ""
+                for chunk in r.iter_content(chunk_size=HTML_CHUNK_SIZE, decode_unicode=True):
+                    buf += chunk
+                    # 조각 경계에 걸친 링크를 놓치지 않도록 조금 겹쳐서 다시 검사
+                    for match in _PDF_LINK_RE.finditer(buf, max(0, scanned - HTML_SCAN_OVERLAP)):
+                        # 1️⃣ 절대 URL이 보이면 즉시 반환
+                        if match.group("abs"):
+                            debug_log("HTML scanned length: %s", len(buf))
+                            return match.group("abs")
+                        # 2️⃣ 상대 URL 탐지 (/recap/...) — 첫 번째만 기억
+                        if not first_rel:
+                            first_rel = match.group("rel")
+                    scanned = len(buf)
+                    if scanned >= HTML_SCAN_LIMIT:
+                        break
+                debug_log("HTML scanned length: %s", len(buf))
+            finally:
+                r.close()
+
+        if first_rel:
+            return STORAGE_BASE + first_rel
 
     except Exception:
         pass
@@ -288,8 +703,8 @@ def _extract_first_pdf_from_docket_html(docket_id: int) -> str:
 # =====================================================
 
 def search_recent_documents(query: str, days: int = 3, max_results: int = 50) -> List[dict]:
-    debug_log(f"CourtListener 검색 중: '{query}'")
-    debug_log(f"search_recent_documents query='{query}' days={days}")   
+    debug_log("CourtListener 검색 중: '%s'", query)
+    debug_log("search_recent_documents query='%s' days=%s", query, days)   
 
 #                          문서단위 검색 vs. 사건단위 검색
 #                         ================================
@@ -321,24 +736,18 @@ def search_recent_documents(query: str, days: int = 3, max_results: int = 50) ->
         return []
 
     results = data.get("results", [])
-    debug_log(f"search results raw count={len(results)}")    
+    debug_log("search results raw count=%s", len(results))    
     # 🔥 FIX: 날짜 기준 비교 (시간 제거)
-    today = datetime.now(timezone.utc).date()
-    cutoff = today - timedelta(days=days)
-    debug_log(f"cutoff date={cutoff}")
+    cutoff = _cutoff_iso(days)
+    debug_log("cutoff date=%s", cutoff)
 
     out = []
     for r in results:
-        date_val = _safe_str(r.get("dateFiled") or r.get("date_filed"))
-        if date_val:
-            try:
-                dt = datetime.fromisoformat(date_val[:10]).date()
-                if dt < cutoff:
-                    debug_log(f"[DEBUG] filtered by date: {dt} < {cutoff}")                    
-                    continue
-            except Exception as e:
-                debug_log(f"[DEBUG] date parse error: {e}")
-                pass
+        # ISO-8601(YYYY-MM-DD)은 문자열 비교가 날짜 비교와 같다 (파싱 불필요)
+        date_val = _safe_str(r.get("dateFiled") or r.get("date_filed"))[:10]
+        if _before_cutoff(date_val, cutoff):
+            debug_log("filtered by date: %s < %s", date_val, cutoff)
+            continue
         out.append(r)
 
     # ✅ BEST PRACTICE: 문서 검색 결과에서 docket_id 안정 확보
@@ -346,10 +755,10 @@ def search_recent_documents(query: str, days: int = 3, max_results: int = 50) ->
         if not hit.get("docket_id"):
             docket_url = hit.get("docket")
             if isinstance(docket_url, str):
-                m = re.search(r"/dockets/(\d+)/", docket_url)
+                m = _DOCKET_URL_RE.search(docket_url)
                 if m:
                     hit["docket_id"] = int(m.group(1))
-                    debug_log(f"[DEBUG] injected docket_id={hit['docket_id']} from docket URL")
+                    debug_log("injected docket_id=%s from docket URL", hit["docket_id"])
 
     return out
 
@@ -357,16 +766,16 @@ def search_recent_documents(query: str, days: int = 3, max_results: int = 50) ->
 def _pick_docket_id(hit: dict) -> Optional[int]:
     for key in ["docket_id", "docketId", "docket"]:
             if hit.get("docket_id"):
-                debug_log(f"Extracted docket_id from hit: {hit['docket_id']}")
+                debug_log("Extracted docket_id from hit: %s", hit["docket_id"])
                 return hit["docket_id"]
             
     # 🔥 NEW: handle string docket URL
     docket_field = hit.get("docket")
     if isinstance(docket_field, str):
-        match = re.search(r"/dockets/(\d+)/", docket_field)
+        match = _DOCKET_URL_RE.search(docket_field)
         if match:
             did = int(match.group(1))
-            debug_log(f"extracted docket_id from URL: {did}")
+            debug_log("extracted docket_id from URL: %s", did)
             return did
     debug_log("docket_id not found in hit")
     
@@ -377,40 +786,123 @@ def _pick_docket_id(hit: dict) -> Optional[int]:
 # Builders
 # =====================================================
 
-def build_case_summaries_from_docket_numbers(docket_numbers: List[str]) -> List[CLCaseSummary]:
-    out = []
-    for dn in docket_numbers:
-        data = _get(DOCKETS_LIST_URL, params={"docket_number": dn})
+def _docket_ids_for_number(dn: str) -> List[int]:
+    data = _get(DOCKETS_LIST_URL, params={"docket_number": dn})
+    if not data:
+        return []
+    return [int(d["id"]) for d in data.get("results", []) if d.get("id")]
+
+
+# docket_number__in 한 번에 묶어 조회할 사건번호 수
+DOCKET_NUMBER_BATCH = 50
+
+
+def _docket_ids_for_number_batch(numbers: List[str]) -> List[int]:
+    """
+    사건번호 묶음을 docket_number__in 한 번(+페이지)으로 조회한다.
+    서버가 필터를 거부하거나 무시한 것으로 보이면 번호별 개별 조회로 폴백한다.
+    """
+    wanted = set(numbers)
+    by_number: Dict[str, List[int]] = {dn: [] for dn in numbers}
+
+    url = DOCKETS_LIST_URL
+    params = {"docket_number__in": ",".join(numbers), "page_size": 100}
+    while url:
+        data = _get(url, params=params) if params else _get(url)
+        params = None
         if not data:
-            continue
-        for d in data.get("results", []):
-            did = d.get("id")
-            if did:
-                s = build_case_summary_from_docket_id(int(did))
-                if s:
-                    out.append(s)
-    return out
+            by_number = {}
+            break
+        results = data.get("results", [])
+        # 필터가 무시되면 요청하지 않은 사건번호가 섞여 온다
+        if any(_safe_str(d.get("docket_number")) not in wanted for d in results):
+            by_number = {}
+            break
+        for d in results:
+            if d.get("id"):
+                by_number[_safe_str(d.get("docket_number"))].append(int(d["id"]))
+        url = data.get("next")
+
+    if not by_number:
+        debug_log("docket_number__in unsupported → per-number lookup (%s)", len(numbers))
+        return [did for ids in _fan_out(_docket_ids_for_number, numbers) for did in ids]
+
+    # 입력 순서 유지
+    return [did for dn in numbers for did in by_number[dn]]
+
+
+# id__in 목록 조회로 미리 받아 둔 도켓 상세 (docket_id → docket). 요약 생성 시 개별 GET 대신 사용
+_docket_prefetch: Dict[int, dict] = {}
+
+
+def _prefetch_docket_batch(ids: List[int]) -> None:
+    """도켓 id 묶음을 id__in 한 번(+페이지)으로 조회해 _docket_prefetch에 채운다."""
+    wanted = set(ids)
+    found: Dict[int, dict] = {}
+    url = DOCKETS_LIST_URL
+    params = {"id__in": ",".join(map(str, ids)), "page_size": 100}
+    while url:
+        data = _get(url, params=params) if params else _get(url)
+        params = None
+        if not data:
+            return
+        results = data.get("results", [])
+        # 필터가 무시되면 요청하지 않은 도켓이 섞여 온다 → 버리고 개별 조회에 맡김
+        if any(d.get("id") not in wanted for d in results):
+            debug_log("id__in unsupported → per-docket lookup (%s)", len(ids))
+            return
+        for d in results:
+            # 필드가 축약된 응답(fields 제한 등)은 저장하지 않고 상세 GET에 맡긴다
+            if "case_name" in d:
+                found[d["id"]] = d
+        url = data.get("next")
+    _docket_prefetch.update(found)
+
+
+def _summaries_for_docket_ids(docket_ids: List[int]) -> List[CLCaseSummary]:
+    # 아직 받아 두지 않은 도켓만 DOCKET_NUMBER_BATCH개씩 묶어 미리 조회한 뒤 도켓별 요약을 병렬 생성
+    missing = [did for did in docket_ids if did not in _docket_prefetch]
+    if len(missing) > 1:
+        _fan_out(_prefetch_docket_batch, [missing[i:i + DOCKET_NUMBER_BATCH] for i in range(0, len(missing), DOCKET_NUMBER_BATCH)])
+    summaries = _fan_out(build_case_summary_from_docket_id, docket_ids)
+    return [s for s in summaries if s]
+
+
+def build_case_summaries_from_docket_numbers(docket_numbers: List[str]) -> List[CLCaseSummary]:
+    numbers = list(dict.fromkeys(dn.strip() for dn in docket_numbers if dn and dn.strip()))
+    batches = [numbers[i:i + DOCKET_NUMBER_BATCH] for i in range(0, len(numbers), DOCKET_NUMBER_BATCH)]
+    docket_ids = list(dict.fromkeys(
+        did for ids in _fan_out(_docket_ids_for_number_batch, batches) for did in ids
+    ))
+    return _summaries_for_docket_ids(docket_ids)
+
+
+def search_recent_documents_many(queries: List[str], days: int = 3, max_results: int = 50) -> List[dict]:
+    """여러 검색 쿼리를 병렬로 실행하고, 쿼리 순서대로 hit를 이어 붙여 반환한다."""
+    hits_per_query = _fan_out(lambda q: search_recent_documents(q, days=days, max_results=max_results), queries)
+    return list(chain.from_iterable(hits_per_query))
 
 
 def build_case_summaries_from_case_titles(case_titles: List[str]) -> List[CLCaseSummary]:
-    out = []
-    for ct in case_titles:
-        hits = search_recent_documents(ct, days=365, max_results=5)
-        out.extend(build_case_summaries_from_hits(hits))
-    return out
+    # 같은 제목은 한 번만 검색하고, 제목별 검색은 병렬로 수행한 뒤 hit를 모아 한 번에 요약
+    titles = list(dict.fromkeys(case_titles))
+    hits_per_title = _fan_out(lambda ct: search_recent_documents(ct, days=365, max_results=5), titles)
+    return build_case_summaries_from_hits(list(chain.from_iterable(hits_per_title)))
 
 
 def build_case_summaries_from_hits(hits: List[dict]) -> List[CLCaseSummary]:
-    out = []
-    debug_log(f"build_case_summaries_from_hits input hits={len(hits)}")    
+    debug_log("build_case_summaries_from_hits input hits=%s", len(hits))    
+    docket_ids = []
+    seen = set()
     for hit in hits:
         did = _pick_docket_id(hit)
-        if did:
-            debug_log(f"found docket_id={did}")            
-            s = build_case_summary_from_docket_id(did)
-            if s:
-                out.append(s)
-    return out
+        # 같은 도켓을 가리키는 hit가 여러 개면 첫 번째만 처리 (입력 순서 유지)
+        if not did or did in seen:
+            continue
+        seen.add(did)
+        debug_log("found docket_id=%s", did)
+        docket_ids.append(did)
+    return _summaries_for_docket_ids(docket_ids)
 
 
 def build_documents_from_docket_ids(docket_ids: List[int], days: int = 3) -> List[CLDocument]:
@@ -422,131 +914,82 @@ def build_complaint_documents_from_hits(
     days: int = 3
 ) -> List[CLDocument]:
 
-    debug_log(f"[DEBUG] build_complaint_documents_from_hits hits={len(hits)} days={days}")
-    out = []
+    debug_log("build_complaint_documents_from_hits hits=%s days=%s", len(hits), days)
 
     # 🔥 FIX: 날짜 기준 비교 (시간 제거)
-    today = datetime.now(timezone.utc).date()
-    cutoff = today - timedelta(days=days)
+    cutoff = _cutoff_iso(days)
 
+    # 같은 도켓을 가리키는 hit는 한 번만 처리 (docket id가 없는 hit는 그대로 둔다)
+    unique_hits = []
+    seen = set()
     for hit in hits:
         did = _pick_docket_id(hit)
-        if not did:
-            debug_log("[DEBUG] no docket_id in hit")         
+        if did and did in seen:
             continue
+        if did:
+            seen.add(did)
+        unique_hits.append(hit)
 
-        docket = _get(DOCKET_URL.format(id=did)) or {}
-        case_name = _safe_str(docket.get("case_name")) or "미확인"
-        docket_number = _safe_str(docket.get("docket_number")) or "미확인"
-        court = _safe_str(docket.get("court")) or "미확인"
+    # 도켓(hit) 단위 작업은 서로 독립적이므로 병렬 처리 후 입력 순서대로 합친다
+    per_hit = _fan_out(lambda hit: _complaint_documents_for_hit(hit, cutoff), unique_hits)
+    return [doc for docs in per_hit for doc in docs]
 
-        debug_log(f"--- Processing docket {did} ---")
-        debug_log(f"case_name={case_name}")
-        debug_log(f"docket_number={docket_number}")
-        debug_log(f"court={court}")     
-        
-        # --------------------------------------------------
-        # 안정화: docket 전체 기준 RECAP pagination 조회
-        # --------------------------------------------------
-        docs = []
-        url = RECAP_DOCS_URL
-        params = {"docket": did, "page_size": 100}
-        debug_log(f"fetching RECAP docs for docket={did}")        
-
-        while url:
-            data = _get(url, params=params) if params else _get(url)
-            params = None
-            if not data:
-                debug_log("RECAP pagination returned no data")                
-                break
-            docs.extend(data.get("results", []))
-            url = data.get("next")
-    
-        debug_log(f"total RECAP docs fetched={len(docs)}")
-        # 🔥 FIX: initialize fallback variables (avoid NameError / leakage)
-        html_pdf_url = ""    
-
-        # =====================================================
-        # ✅ BEST PRACTICE: RECAP → HTML fallback
-        # =====================================================
-        if not docs:
-            debug_log("RECAP empty → HTML fallback activated")
-            html_pdf_url = _extract_first_pdf_from_docket_html(did)
-
-            if html_pdf_url:
-                debug_log(f"HTML fallback PDF URL: {html_pdf_url}")
-                # Complaint 구조는 보통 Caption (당사자), Jurisdiction, Background, Factual Allegations, Causes of Action 등으로 구성 되며, 
-                # AI 학습 관련 주장도 보통 초반 5페이지 이내에 등장합니다.
-                # 4500자 의미: 약 2~3페이지 분량 (약 700~900 단어), 'PDF 전체 대신 앞부분 4500자만 분석을하겠다.'는 최적화를 위한 제한 값입니다.
-                snippet = extract_pdf_text(html_pdf_url, max_chars=4500)
-
-                if not snippet:
-                    debug_log(f"[ERROR] PDF parsing FAILED (HTML fallback)")
-                    debug_log(f"[ERROR] URL: {html_pdf_url}")
-                else:
-                    debug_log(f"PDF parsing SUCCESS length={len(snippet)}")
-
-
-                p_ex, d_ex = extract_parties_from_caption(snippet) if snippet else ("미확인", "미확인")
-                debug_log(f"HTML fallback snippet length={len(snippet) if snippet else 0}")                
-                causes = detect_causes(snippet) if snippet else []
-                ai_snip = extract_ai_training_snippet(snippet) if snippet else ""
-
-                out.append(CLDocument(
-                    docket_id=did,
-                    docket_number=docket_number,
-                    case_name=case_name,
-                    court=court,
-                    date_filed=_safe_str(docket.get("date_filed"))[:10],
-                    doc_type="Complaint (HTML Fallback)",
-                    doc_number="1",
-                    description="Extracted from docket HTML",
-                    document_url=html_pdf_url,
-                    pdf_url=html_pdf_url,
-                    pdf_text_snippet=snippet,
-                    extracted_plaintiff=p_ex,
-                    extracted_defendant=d_ex,
-                    extracted_causes=", ".join(causes) if causes else "미확인",
-                    extracted_ai_snippet=ai_snip,
-                ))
-            # RECAP 완전 실패한 경우에만 fallback 실행       
-        
-        for d in docs:
-            desc = _safe_str(d.get("description")).lower()
-            if not any(k in desc for k in COMPLAINT_KEYWORDS):
-                debug_log(f"skipped non-complaint doc: {desc[:60]}")                
-                continue
-
-            date_filed = _safe_str(d.get("date_filed"))[:10]
-            if date_filed:
-                try:
-                    dt = datetime.fromisoformat(date_filed).date()
-                    if dt < cutoff:
-                        debug_log(f"complaint filtered by date {dt} < {cutoff}")                        
-                        continue
-                except Exception as e:
-                    debug_log(f"complaint date parse error: {e}")
-                    pass
-            debug_log(f"complaint accepted docket={did} date={date_filed}")
-            debug_log(f"description={d.get('description')}")
-            debug_log(f"document_number={d.get('document_number')}")            
-            pdf_url = _abs_url(d.get("filepath_local") or "")
-            debug_log(f"RECAP PDF URL: {pdf_url}")
-            snippet = ""
-
-            if pdf_url and _validate_pdf_url(pdf_url):
-                snippet = extract_pdf_text(pdf_url, max_chars=3000)
+
+def _complaint_documents_for_hit(hit: dict, cutoff: str) -> List[CLDocument]:
+    out: List[CLDocument] = []
+    did = _pick_docket_id(hit)
+    if not did:
+        debug_log("no docket_id in hit")         
+        return out
+
+    # 도켓 메타와 RECAP 목록은 서로 독립적이므로 도켓 요청을 먼저 띄워 두고 RECAP을 받는다
+    docket_future = _PREFETCH_POOL.submit(_get, DOCKET_URL.format(id=did))
+
+    # --------------------------------------------------
+    # 안정화: docket 전체 기준 RECAP pagination 조회
+    # --------------------------------------------------
+    debug_log("fetching RECAP docs for docket=%s", did)        
+    docs = _fetch_recap_docs(did)
+
+    debug_log("total RECAP docs fetched=%s", len(docs))
+
+    docket = docket_future.result() or {}
+    case_name = _safe_str(docket.get("case_name")) or "미확인"
+    docket_number = _safe_str(docket.get("docket_number")) or "미확인"
+    court = _safe_str(docket.get("court")) or "미확인"
+
+    debug_log("--- Processing docket %s ---", did)
+    debug_log("case_name=%s", case_name)
+    debug_log("docket_number=%s", docket_number)
+    debug_log("court=%s", court)     
+    # 🔥 FIX: initialize fallback variables (avoid NameError / leakage)
+    html_pdf_url = ""    
+
+    # =====================================================
+    # ✅ BEST PRACTICE: RECAP → HTML fallback
+    # =====================================================
+    # docs는 서버에서 소장 후보로 걸러진 목록이므로, 비어 있어도 도켓에 다른 RECAP 문서가 있으면
+    # fallback하지 않는다 (필터 도입 전과 같이 "RECAP 문서가 전혀 없을 때"만)
+    if not docs and not _docket_has_recap_docs(did):
+        debug_log("RECAP empty → HTML fallback activated")
+        html_pdf_url = _extract_first_pdf_from_docket_html(did)
+
+        if html_pdf_url:
+            debug_log("HTML fallback PDF URL: %s", html_pdf_url)
+            # Complaint 구조는 보통 Caption (당사자), Jurisdiction, Background, Factual Allegations, Causes of Action 등으로 구성 되며, 
+            # AI 학습 관련 주장도 보통 초반 5페이지 이내에 등장합니다.
+            # 4500자 의미: 약 2~3페이지 분량 (약 700~900 단어), 'PDF 전체 대신 앞부분 4500자만 분석을하겠다.'는 최적화를 위한 제한 값입니다.
+            snippet = extract_pdf_text(html_pdf_url, max_chars=4500)
+
+            if not snippet:
+                debug_log("[ERROR] PDF parsing FAILED (HTML fallback)")
+                debug_log("[ERROR] URL: %s", html_pdf_url)
             else:
-                debug_log("[ERROR] PDF validation failed — skipping extraction")
-                debug_log(f"[ERROR] URL: {pdf_url}")
+                debug_log("PDF parsing SUCCESS length=%s", len(snippet))
 
-            if pdf_url and not snippet:
-                debug_log("[ERROR] PDF parsing FAILED (RECAP)")
-                debug_log(f"[ERROR] URL: {pdf_url}")
-            elif snippet:
-                debug_log(f"PDF parsing SUCCESS length={len(snippet)}")
 
             p_ex, d_ex = extract_parties_from_caption(snippet) if snippet else ("미확인", "미확인")
+            debug_log("HTML fallback snippet length=%s", len(snippet) if snippet else 0)                
             causes = detect_causes(snippet) if snippet else []
             ai_snip = extract_ai_training_snippet(snippet) if snippet else ""
 
@@ -555,37 +998,129 @@ def build_complaint_documents_from_hits(
                 docket_number=docket_number,
                 case_name=case_name,
                 court=court,
-                date_filed=date_filed,
-                doc_type="Complaint",
-                doc_number=_safe_str(d.get("document_number")),
-                description=_safe_str(d.get("description")),
-                document_url=_abs_url(d.get("absolute_url") or ""),
-                pdf_url=pdf_url,
+                date_filed=_safe_str(docket.get("date_filed"))[:10],
+                doc_type="Complaint (HTML Fallback)",
+                doc_number="1",
+                description="Extracted from docket HTML",
+                document_url=html_pdf_url,
+                pdf_url=html_pdf_url,
                 pdf_text_snippet=snippet,
                 extracted_plaintiff=p_ex,
                 extracted_defendant=d_ex,
                 extracted_causes=", ".join(causes) if causes else "미확인",
                 extracted_ai_snippet=ai_snip,
             ))
+        # RECAP 완전 실패한 경우에만 fallback 실행       
+    
+    # 1) 소장 후보만 먼저 추린다
+    candidates = []
+    for d in docs:
+        desc = _safe_str(d.get("description"))
+        if not _COMPLAINT_RE.search(desc):
+            debug_log("skipped non-complaint doc: %.60s", desc)
+            continue
+
+        date_filed = _safe_str(d.get("date_filed"))[:10]
+        if _before_cutoff(date_filed, cutoff):
+            debug_log("complaint filtered by date %s < %s", date_filed, cutoff)
+            continue
+        pdf_url = _abs_url(d.get("filepath_local") or "")
+        debug_log(
+            "complaint accepted docket=%s date=%s description=%s document_number=%s RECAP PDF URL: %s",
+            did, date_filed, d.get("description"), d.get("document_number"), pdf_url,
+        )
+        candidates.append((d, date_filed, pdf_url))
+
+    # 2) PDF 다운로드/파싱은 문서별로 독립적이므로 병렬로 수행 (Σt → max t)
+    snippets = _fan_out(_recap_pdf_snippet, [pdf_url for _, _, pdf_url in candidates])
+
+    # 3) 입력 순서대로 결과 조립
+    for (d, date_filed, pdf_url), snippet in zip(candidates, snippets):
+        p_ex, d_ex = extract_parties_from_caption(snippet) if snippet else ("미확인", "미확인")
+        causes = detect_causes(snippet) if snippet else []
+        ai_snip = extract_ai_training_snippet(snippet) if snippet else ""
+
+        out.append(CLDocument(
+            docket_id=did,
+            docket_number=docket_number,
+            case_name=case_name,
+            court=court,
+            date_filed=date_filed,
+            doc_type="Complaint",
+            doc_number=_safe_str(d.get("document_number")),
+            description=_safe_str(d.get("description")),
+            document_url=_abs_url(d.get("absolute_url") or ""),
+            pdf_url=pdf_url,
+            pdf_text_snippet=snippet,
+            extracted_plaintiff=p_ex,
+            extracted_defendant=d_ex,
+            extracted_causes=", ".join(causes) if causes else "미확인",
+            extracted_ai_snippet=ai_snip,
+        ))
 
     return out
 
 
+def _recap_pdf_snippet(pdf_url: str) -> str:
+    snippet = ""
+
+    head = _validate_pdf_url(pdf_url)
+    if head is not None:
+        # PDF도 CourtListener 스토리지에서 받으므로 같은 동시 요청 상한을 적용
+        with _cl_slots:
+            snippet = extract_pdf_text(pdf_url, max_chars=3000, head=head)
+    else:
+        debug_log("[ERROR] PDF validation failed — skipping extraction")
+        debug_log("[ERROR] URL: %s", pdf_url)
+
+    if pdf_url and not snippet:
+        debug_log("[ERROR] PDF parsing FAILED (RECAP)")
+        debug_log("[ERROR] URL: %s", pdf_url)
+    elif snippet:
+        debug_log("PDF parsing SUCCESS length=%s", len(snippet))
+
+    return snippet
+
+
+# build_case_summary_from_docket_id에서 읽는 도켓 필드
+_SUMMARY_DOCKET_FIELDS = (
+    "case_name", "docket_number", "court",
+    "date_filed", "date_terminated",
+    "assigned_to_str", "assigned_to",
+    "nature_of_suit", "nature_of_suit_display", "nos",
+    "cause", "cause_of_action",
+    "date_modified", "date_last_filing",
+)
+
+
 def build_case_summary_from_docket_id(docket_id: int) -> Optional[CLCaseSummary]:
-    docket = _get(DOCKET_URL.format(id=docket_id))
-    if not docket:
+    try:
+        return _build_case_summary_cached(docket_id)
+    except _NotCached:
         return None
-    debug_log(f"=== build_case_summary_from_docket_id {docket_id} ===")
-    debug_log(f"case_name={docket.get('case_name')}")
-    debug_log(f"docket_number={docket.get('docket_number')}")
 
-    case_name = _safe_str(docket.get("case_name")) or "미확인"
-    docket_number = _safe_str(docket.get("docket_number")) or "미확인"
-    court = _safe_str(docket.get("court")) or "미확인"
+
+# 실행 중 같은 도켓은 결과가 바뀌지 않으므로 (뉴스/제목/번호 확장 경로 간에도) 한 번만 만든다
+# 도켓 조회 실패는 캐시하지 않아 다른 경로에서 다시 시도할 수 있다
+@lru_cache(maxsize=None)
+def _build_case_summary_cached(docket_id: int) -> CLCaseSummary:
+    docket = _docket_prefetch.get(docket_id) or _get(DOCKET_URL.format(id=docket_id))
+    if not docket:
+        raise _NotCached(docket_id)
+    debug_log("=== build_case_summary_from_docket_id %s ===", docket_id)
+    debug_log("case_name=%s", docket.get('case_name'))
+    debug_log("docket_number=%s", docket.get('docket_number'))
+
+    # 요약에 쓰는 도켓 필드를 한 번에 정규화 (필드별 반복 _safe_str 호출 제거)
+    f = {k: _safe_str(docket.get(k)) for k in _SUMMARY_DOCKET_FIELDS}
+
+    case_name = f["case_name"] or "미확인"
+    docket_number = f["docket_number"] or "미확인"
+    court = f["court"] or "미확인"
     court_short_name, court_api_url = _build_court_meta(court)
 
-    date_filed = _safe_str(docket.get("date_filed"))[:10]
-    date_terminated = _safe_str(docket.get("date_terminated"))[:10]
+    date_filed = f["date_filed"][:10]
+    date_terminated = f["date_terminated"][:10]
 
     if date_terminated:
         status = f"종결 ({date_terminated})"
@@ -594,28 +1129,20 @@ def build_case_summary_from_docket_id(docket_id: int) -> Optional[CLCaseSummary]
     else:
         status = "미확인"
 
-    judge = (
-        _safe_str(docket.get("assigned_to_str"))
-        or _safe_str(docket.get("assigned_to"))
-        or "미확인"
-    )
+    judge = f["assigned_to_str"] or f["assigned_to"] or "미확인"
 
     nature_of_suit = (
-        _safe_str(docket.get("nature_of_suit"))
-        or _safe_str(docket.get("nature_of_suit_display"))
-        or _safe_str(docket.get("nos"))
+        f["nature_of_suit"]
+        or f["nature_of_suit_display"]
+        or f["nos"]
         or "미확인"
     )
 
-    cause = (
-        _safe_str(docket.get("cause"))
-        or _safe_str(docket.get("cause_of_action"))
-        or "미확인"
-    )
+    cause = f["cause"] or f["cause_of_action"] or "미확인"
 
     recent_updates = (
-        _safe_str(docket.get("date_modified"))[:10]
-        or _safe_str(docket.get("date_last_filing"))[:10]
+        f["date_modified"][:10]
+        or f["date_last_filing"][:10]
         or "미확인"
     )
 
@@ -635,27 +1162,8 @@ def build_case_summary_from_docket_id(docket_id: int) -> Optional[CLCaseSummary]
     # 그리고 결과를 RECAP 테이블 컬럼에 직접 매핑
     # ======================================================
 
-    # 1️⃣ RECAP API 먼저 시도
-    recap_docs = []
-    url = RECAP_DOCS_URL
-    params = {"docket": docket_id, "page_size": 100}
-
-    while url:
-        data = _get(url, params=params) if params else _get(url)
-        params = None
-        if not data:
-            break
-        recap_docs.extend(data.get("results", []))
-        url = data.get("next")
-
-    complaint_doc = None
-
-    for d in recap_docs:
-        debug_log(f"checking RECAP doc: {d.get('description')}")        
-        desc = _safe_str(d.get("description")).lower()
-        if any(k in desc for k in COMPLAINT_KEYWORDS):
-            complaint_doc = d
-            break
+    # 1️⃣ RECAP API 먼저 시도 (문서 빌더와 같은 도켓 조회 결과를 공유)
+    complaint_doc = _first_complaint_doc(docket_id)
 
     # 2️⃣ RECAP 문서가 있으면 사용
     if complaint_doc:
@@ -667,8 +1175,8 @@ def build_case_summary_from_docket_id(docket_id: int) -> Optional[CLCaseSummary]
             or complaint_doc.get("absolute_url")
             or ""
         )
-        debug_log(f"complaint_doc_no={complaint_doc_no}")
-        debug_log(f"complaint_link={complaint_link}")
+        debug_log("complaint_doc_no=%s", complaint_doc_no)
+        debug_log("complaint_link=%s", complaint_link)
         complaint_type = _detect_complaint_type(_safe_str(complaint_doc.get("description")))
 
     # 3️⃣ 없으면 HTML fallback
@@ -677,28 +1185,29 @@ def build_case_summary_from_docket_id(docket_id: int) -> Optional[CLCaseSummary]
         
         html_pdf_url = _extract_first_pdf_from_docket_html(docket_id)
         if html_pdf_url:
-            debug_log(f"HTML fallback PDF found: {html_pdf_url}")            
+            debug_log("HTML fallback PDF found: %s", html_pdf_url)            
             complaint_link = html_pdf_url
             complaint_doc_no = "1"
             complaint_type = "Complaint (HTML Fallback)"
         else:
             debug_log("HTML fallback failed — no PDF found")
 
-        debug_log(f"final complaint_link={complaint_link}")
+        debug_log("final complaint_link=%s", complaint_link)
     
     # 4️⃣ PDF 텍스트 분석
     if complaint_link:
-        debug_log(f"Extracting PDF text from: {complaint_link}")     
+        debug_log("Extracting PDF text from: %s", complaint_link)     
         debug_log("Starting PDF extraction...")        
         snippet = ""
 
-        if _validate_pdf_url(complaint_link):
-            snippet = extract_pdf_text(complaint_link, max_chars=4000)
+        head = _validate_pdf_url(complaint_link)
+        if head is not None:
+            snippet = extract_pdf_text(complaint_link, max_chars=4000, head=head)
         else:
             debug_log("[ERROR] Complaint PDF validation failed")
-            debug_log(f"[ERROR] complaint_link={complaint_link}")
+            debug_log("[ERROR] complaint_link=%s", complaint_link)
 
-        debug_log(f"PDF snippet length={len(snippet) if snippet else 0}")
+        debug_log("PDF snippet length=%s", len(snippet) if snippet else 0)
 
         if snippet:
             debug_log("===== PDF TEXT PREVIEW BEGIN =====")
@@ -707,18 +1216,18 @@ def build_case_summary_from_docket_id(docket_id: int) -> Optional[CLCaseSummary]
         else:
             debug_log("PDF text extraction returned EMPTY STRING")
             debug_log("[ERROR] PDF text extraction FAILED")
-            debug_log(f"[ERROR] complaint_link={complaint_link}")
+            debug_log("[ERROR] complaint_link=%s", complaint_link)
             debug_log("[ERROR] Possible causes:")
             debug_log("  - 403 Access denied")
             debug_log("  - Non-PDF response")
             debug_log("  - Corrupted file")
 
-        debug_log(f"PDF snippet length={len(snippet) if snippet else 0}")        
+        debug_log("PDF snippet length=%s", len(snippet) if snippet else 0)        
         if snippet:
             extracted_ai_snippet = extract_ai_training_snippet(snippet) or ""
             causes_list = detect_causes(snippet)
-            debug_log(f"extracted_ai_snippet length={len(extracted_ai_snippet)}")
-            debug_log(f"detected causes={causes_list}")            
+            debug_log("extracted_ai_snippet length=%s", len(extracted_ai_snippet))
+            debug_log("detected causes=%s", causes_list)            
             extracted_causes = ", ".join(causes_list) if causes_list else "미확인"
         else:
             debug_log("WARNING: PDF text extraction returned empty snippet")
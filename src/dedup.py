@@ -1,11 +1,19 @@
 from __future__ import annotations
 import re
-from typing import List, Set, Tuple
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from .utils import debug_log
 
-def extract_section(md_text: str, section_title: str) -> str:
-    """Markdown 텍스트에서 특정 섹션 제목 아래의 내용을 추출합니다."""
-    lines = md_text.split("\n")
+# 행/셀 파싱은 이전 코멘트 전체 행에 반복 적용되므로 패턴을 미리 컴파일
+_TABLE_PIPE_RE = re.compile(r'(?<!\\)\|')  # 역슬래시로 이스케이프되지 않은 파이프
+_TABLE_LINE_RE = re.compile(r"^[^\S\n]*\|.*", re.MULTILINE)  # 앞 공백을 제외하고 '|'로 시작하는 라인
+_ARTICLE_URL_RE = re.compile(r"\((https?://[^\)]+)\)")
+_RISK_SCORE_RE = re.compile(r"(\d+)")
+
+def _section_span(lines: List[str], section_title: str) -> Optional[Tuple[int, int]]:
+    """섹션 제목 아래 내용의 라인 범위 [start, end)를 반환합니다. 없으면 None."""
     start = None
     end = None
     for i, line in enumerate(lines):
@@ -16,148 +24,201 @@ def extract_section(md_text: str, section_title: str) -> str:
             end = i
             break
     if start is None:
-        return ""
+        return None
     if end is None:
         end = len(lines)
-    return "\n".join(lines[start:end])
+    return start, end
 
-def parse_table(section_md: str) -> Tuple[List[str], List[List[str]], Tuple[str, str]]:
-    """Markdown 테이블을 헤더, 행 데이터, 메타데이터(헤더/구분선 라인)로 파싱합니다."""
-    lines = [l for l in section_md.split("\n") if l.strip().startswith("|")]
+def extract_section(md_text: str, section_title: str) -> str:
+    """Markdown 텍스트에서 특정 섹션 제목 아래의 내용을 추출합니다."""
+    return extract_sections(md_text, section_title)[0]
+
+def extract_sections(md_text: str, *section_titles: str) -> List[str]:
+    """여러 섹션을 한 번의 라인 분할로 추출합니다. (제목 순서대로, 없는 섹션은 "")"""
+    # 제목 문자열 자체가 없으면 섹션도 없음 → 라인 분할/스캔 생략
+    present = [t in md_text for t in section_titles]
+    if not any(present):
+        return [""] * len(section_titles)
+    lines = md_text.split("\n")
+    out = []
+    for title, ok in zip(section_titles, present):
+        span = _section_span(lines, title) if ok else None
+        out.append("\n".join(lines[span[0]:span[1]]) if span else "")
+    return out
+
+def _split_row(row_text: str) -> Tuple[str, ...]:
+    # 역슬래시로 이스케이프되지 않은 파이프만 분할
+    # 이스케이프된 파이프가 없으면(대부분의 행) 정규식 없이 str.split으로 동일한 결과
+    row_text = row_text.strip()
+    cells = row_text.split("|") if "\\|" not in row_text else _TABLE_PIPE_RE.split(row_text)
+    return tuple(c.strip() for c in cells[1:-1])
+
+@lru_cache(maxsize=256)
+def _parse_table_cached(section_md: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...], Tuple[str, str]]:
+    # 같은 섹션(같은 이전 댓글)이 dedup/통합 리포트에서 반복 파싱되므로 불변 결과를 캐시
+    # 파이프가 하나도 없으면(섹션 없음 또는 "0건" 문구) 라인 분할 자체를 생략
+    if "|" not in section_md:
+        return (), (), ("", "")
+    lines = _TABLE_LINE_RE.findall(section_md)
     if len(lines) < 3:
-        return [], [], ("", "")
+        return (), (), ("", "")
 
     header = lines[0]
     separator = lines[1]
     rows = lines[2:]
 
-    def split_row(row_text: str) -> List[str]:
-        # 역슬래시로 이스케이프되지 않은 파이프만 분할
-        return [c.strip() for c in re.split(r'(?<!\\)\|', row_text.strip())[1:-1]]
-
-    header_cols = split_row(header)
+    header_cols = _split_row(header)
     parsed_rows = []
     for row in rows:
-        cols = split_row(row)
+        cols = _split_row(row)
         if len(cols) == len(header_cols):
             parsed_rows.append(cols)
         else:
-            debug_log(f"Table row column mismatch: expected {len(header_cols)}, got {len(cols)}. Row: {row[:100]}...")
+            debug_log("Table row column mismatch: expected %d, got %d. Row: %.100s...", len(header_cols), len(cols), row)
 
-    return header_cols, parsed_rows, (header, separator)
+    return header_cols, tuple(parsed_rows), (header, separator)
 
+def parse_table(section_md: str) -> Tuple[List[str], List[List[str]], Tuple[str, str]]:
+    """Markdown 테이블을 헤더, 행 데이터, 메타데이터(헤더/구분선 라인)로 파싱합니다."""
+    header_cols, rows, meta = _parse_table_cached(section_md)
+    # 호출자가 행을 수정(No. 재번호 등)하므로 캐시된 튜플이 아닌 새 리스트로 반환
+    return list(header_cols), [list(r) for r in rows], meta
+
+def _column_index(header_cols: List[str]) -> Dict[str, int]:
+    """헤더명 → 컬럼 인덱스 (중복 헤더는 list.index처럼 첫 번째 위치)"""
+    col: Dict[str, int] = {}
+    for i, name in enumerate(header_cols):
+        col.setdefault(name, i)
+    return col
+
+@lru_cache(maxsize=4096)
 def extract_article_url(cell: str) -> str | None:
-    """Markdown 링크 셀에서 URL을 추출합니다."""
-    m = re.search(r"\((https?://[^\)]+)\)", cell)
+    """Markdown 링크 셀에서 URL을 추출합니다. (같은 셀이 댓글/통합 리포트마다 반복되므로 캐시)"""
+    m = _ARTICLE_URL_RE.search(cell)
     if m:
-        return m.group(1).split("&hl=")[0]
+        # intern: baseline 집합 조회 시 해시 일치 후 동일 객체 비교로 끝나도록
+        return sys.intern(m.group(1).split("&hl=")[0])
     return None
 
-def apply_deduplication(md: str, comments: List[dict]) -> str:
+@lru_cache(maxsize=256)
+def _risk_score(cell: str) -> int:
+    """위험도 셀(예: "🟡 45")에서 숫자만 추출합니다. 없으면 0."""
+    m = _RISK_SCORE_RE.search(cell)
+    return int(m.group(1)) if m else 0
+
+@lru_cache(maxsize=128)
+def _index_comment(body: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """이전 댓글 본문에서 (기사 URL 집합, 도켓번호 집합)을 한 번만 추출합니다."""
+    # 본문은 한 번만 분할하고, 필요한 열(제목/도켓번호)만 읽어 바로 집합으로 만든다
+    # (캐시된 파싱 결과를 그대로 읽으므로 행 복사 없음)
+    news_section, recap_section = extract_sections(body, "## 📰 AI Suit News", "## ⚖️ Cases")
+
+    # News 처리 (오직 'AI Suit News'만 지원)
+    h_news, r_news, _ = _parse_table_cached(news_section)
+    idx = _column_index(h_news).get("제목")
+    articles = frozenset(
+        url for r in r_news if (url := extract_article_url(r[idx]))
+    ) if idx is not None else frozenset()
+
+    # Cases 처리
+    h_cases, r_cases, _ = _parse_table_cached(recap_section)
+    idx = _column_index(h_cases).get("도켓번호")
+    dockets = frozenset(sys.intern(r[idx]) for r in r_cases) if idx is not None else frozenset()
+
+    return articles, dockets
+
+
+@dataclass(slots=True, frozen=True)
+class DedupStats:
+    """중복 제거 요약 수치 (Slack 요약 등에서 md를 다시 파싱하지 않고 그대로 사용)"""
+    base_news: int
+    dup_news: int
+    new_news: int
+    base_cases: int
+    dup_cases: int
+    new_cases: int
+
+
+def apply_deduplication(md: str, comments: List[dict]) -> Tuple[str, Optional[DedupStats]]:
     """
     이전 GitHub 댓글들을 분석하여 중복된 데이터를 'skip' 처리하고 요약을 추가합니다.
+    (결과 md, 요약 수치)를 반환하며, 이전 댓글이 없으면 요약 없이 (md, None)입니다.
     """
     if not comments:
-        return md
+        return md, None
 
-    # 1) Base Snapshot Key Set 생성 (모든 이전 댓글 대상)
+    # 1) Base Snapshot Key Set 생성 (모든 이전 댓글 대상, 댓글 본문별 인덱스는 캐시)
     base_article_set: Set[str] = set()
     base_docket_set: Set[str] = set()
 
     for comment in comments:
-        body = comment.get("body") or ""
-        
-        # News 처리 (오직 'AI Suit News'만 지원)
-        news_section_base = extract_section(body, "## 📰 AI Suit News")
-        h_news, r_news, _ = parse_table(news_section_base)
-        if "제목" in h_news:
-            idx = h_news.index("제목")
-            for r in r_news:
-                url = extract_article_url(r[idx])
-                if url:
-                    base_article_set.add(url)
-        
-        # Cases 처리
-        recap_section_base = extract_section(body, "## ⚖️ Cases")
-        h_cases, r_cases, _ = parse_table(recap_section_base)
-        if "도켓번호" in h_cases:
-            idx = h_cases.index("도켓번호")
-            for r in r_cases:
-                base_docket_set.add(r[idx])
+        articles, dockets = _index_comment(comment.get("body") or "")
+        base_article_set |= articles
+        base_docket_set |= dockets
 
     # 2) 현재 Markdown 처리 (News - 새 이름 사용)
-    current_md = md
-    news_section = extract_section(current_md, "## 📰 AI Suit News")
+    # 섹션은 라인 범위로 찾아 그 자리만 교체한다 (문서 전체 str.replace 재스캔 없음)
+    md_lines = md.split("\n")
+    news_span = _section_span(md_lines, "## 📰 AI Suit News")
+    news_section = "\n".join(md_lines[news_span[0]:news_span[1]]) if news_span else ""
     n_headers, n_rows, n_table_meta = parse_table(news_section)
 
     new_article_count = 0
     total_article_count = len(n_rows)
 
-    if n_headers and "제목" in n_headers:
-        title_idx = n_headers.index("제목")
-        no_idx = n_headers.index("No.") if "No." in n_headers else None
-        date_idx = n_headers.index("기사일자") if "기사일자" in n_headers else None
-        risk_idx = n_headers.index("위험도⬇️") if "위험도⬇️" in n_headers else None
-
-        header_line, separator_line = n_table_meta
-        non_skip_rows = []
+    n_col = _column_index(n_headers)
+    if "제목" in n_col:
+        title_idx = n_col["제목"]
+        no_idx = n_col.get("No.")
+        date_idx = n_col.get("기사일자")
+        risk_idx = n_col.get("위험도⬇️")
 
+        # 중복 판정과 번호 재부여/행 출력을 한 번의 순회로 처리
+        new_lines = list(n_table_meta)
         for r in n_rows:
             url = extract_article_url(r[title_idx])
             if url in base_article_set:
-                debug_log(f"Skipping duplicate News: {r[title_idx]} ({url})")
-            else:
-                non_skip_rows.append(r)
-                new_article_count += 1
-        
+                debug_log("Skipping duplicate News: %s (%s)", r[title_idx], url)
+                continue
+            new_article_count += 1
+            if no_idx is not None:
+                r[no_idx] = str(new_article_count)
+            new_lines.append("| " + " | ".join(r) + " |")
+
         if new_article_count == 0:
-            new_news_section = "새로운 소식이 0건입니다.\n"
-        else:
-            final_rows = non_skip_rows
-            new_lines = [header_line, separator_line]
-            for row_idx, r in enumerate(final_rows, start=1):
-                if no_idx is not None:
-                    r[no_idx] = str(row_idx)
-                new_lines.append("| " + " | ".join(r) + " |")
-            new_news_section = "\n".join(new_lines)
-        current_md = current_md.replace(news_section, new_news_section)
+            new_lines = ["새로운 소식이 0건입니다.", ""]
+        md_lines[news_span[0]:news_span[1]] = new_lines
 
     # 3) 현재 Markdown 처리 (Cases)
-    recap_section = extract_section(current_md, "## ⚖️ Cases")
+    recap_span = _section_span(md_lines, "## ⚖️ Cases")
+    recap_section = "\n".join(md_lines[recap_span[0]:recap_span[1]]) if recap_span else ""
     c_headers, c_rows, c_table_meta = parse_table(recap_section)
 
     new_docket_count = 0
     total_docket_count = len(c_rows)
 
-    if c_headers and "도켓번호" in c_headers:
-        docket_idx = c_headers.index("도켓번호")
-        no_idx = c_headers.index("No.") if "No." in c_headers else None
-        risk_idx = c_headers.index("위험도⬇️") if "위험도⬇️" in c_headers else None
-        status_idx = c_headers.index("상태") if "상태" in c_headers else None
-        case_idx = c_headers.index("케이스명") if "케이스명" in c_headers else None
-
-        header_line, separator_line = c_table_meta
-        non_skip_rows = []
+    c_col = _column_index(c_headers)
+    if "도켓번호" in c_col:
+        docket_idx = c_col["도켓번호"]
+        no_idx = c_col.get("No.")
+        risk_idx = c_col.get("위험도⬇️")
+        status_idx = c_col.get("상태")
+        case_idx = c_col.get("케이스명")
 
+        new_lines = list(c_table_meta)
         for r in c_rows:
-            docket = r[docket_idx]
+            docket = sys.intern(r[docket_idx])
             if docket in base_docket_set:
-                debug_log(f"Skipping duplicate Case: {r[case_idx]} ({docket})")
-            else:
-                non_skip_rows.append(r)
-                new_docket_count += 1
+                debug_log("Skipping duplicate Case: %s (%s)", r[case_idx], docket)
+                continue
+            new_docket_count += 1
+            if no_idx is not None:
+                r[no_idx] = str(new_docket_count)
+            new_lines.append("| " + " | ".join(r) + " |")
 
         if new_docket_count == 0:
-            new_recap_section = "새로운 소식이 0건입니다.\n"
-        else:
-            final_rows = non_skip_rows
-            new_lines = [header_line, separator_line]
-            for row_idx, r in enumerate(final_rows, start=1):
-                if no_idx is not None:
-                    r[no_idx] = str(row_idx)
-                new_lines.append("| " + " | ".join(r) + " |")
-            new_recap_section = "\n".join(new_lines)
-        current_md = current_md.replace(recap_section, new_recap_section)
+            new_lines = ["새로운 소식이 0건입니다.", ""]
+        md_lines[recap_span[0]:recap_span[1]] = new_lines
 
     # 4) 중복 제거 요약 생성
     base_news = len(base_article_set)
@@ -179,7 +240,8 @@ def apply_deduplication(md: str, comments: List[dict]) -> str:
         f"{new_cases_label}\n\n"
     )
 
-    return summary_header + current_md
+    stats = DedupStats(base_news, dup_news, new_article_count, base_cases, dup_cases, new_docket_count)
+    return summary_header + "\n".join(md_lines), stats
 
 
 def generate_consolidated_report(comments: List[dict]) -> str:
@@ -203,11 +265,12 @@ def generate_consolidated_report(comments: List[dict]) -> str:
     for comment in comments:
         body = comment.get("body") or ""
 
+        news_section, recap_section = extract_sections(body, "## 📰 AI Suit News", "## ⚖️ Cases")
+
         # 1) News 파이싱
-        news_section = extract_section(body, "## 📰 AI Suit News")
         h_news, r_news, meta_news = parse_table(news_section)
-        if h_news and "제목" in h_news:
-            title_idx = h_news.index("제목")
+        title_idx = _column_index(h_news).get("제목")
+        if title_idx is not None:
             if not news_header_line:
                 news_header_cols = h_news
                 news_header_line, news_sep_line = meta_news
@@ -219,10 +282,9 @@ def generate_consolidated_report(comments: List[dict]) -> str:
                     unique_news[key] = r
 
         # 2) Cases 파싱
-        recap_section = extract_section(body, "## ⚖️ Cases")
         h_cases, r_cases, meta_cases = parse_table(recap_section)
-        if h_cases and "도켓번호" in h_cases:
-            docket_idx = h_cases.index("도켓번호")
+        docket_idx = _column_index(h_cases).get("도켓번호")
+        if docket_idx is not None:
             if not case_header_line:
                 case_header_cols = h_cases
                 case_header_line, case_sep_line = meta_cases
@@ -242,15 +304,12 @@ def generate_consolidated_report(comments: List[dict]) -> str:
         
         # 위험도 예측 점수 기준으로 내림차순 정렬
         news_rows = list(unique_news.values())
-        if "위험도⬇️" in news_header_cols:
-            risk_idx = news_header_cols.index("위험도⬇️")
-            def get_news_risk_score(row):
-                # "🟡 45"와 같은 문자열에서 숫자만 추출
-                m = re.search(r"(\d+)", row[risk_idx])
-                return int(m.group(1)) if m else 0
-            news_rows.sort(key=get_news_risk_score, reverse=True)
-
-        no_idx = news_header_cols.index("No.") if "No." in news_header_cols else None
+        news_col = _column_index(news_header_cols)
+        risk_idx = news_col.get("위험도⬇️")
+        if risk_idx is not None:
+            news_rows.sort(key=lambda row: _risk_score(row[risk_idx]), reverse=True)
+
+        no_idx = news_col.get("No.")
         for i, row_data in enumerate(news_rows, 1):
             row = list(row_data)
             if no_idx is not None:
@@ -268,15 +327,12 @@ def generate_consolidated_report(comments: List[dict]) -> str:
         
         # 위험도 기준으로 내림차순 정렬
         case_rows = list(unique_cases.values())
-        if "위험도⬇️" in case_header_cols:
-            risk_idx = case_header_cols.index("위험도⬇️")
-            def get_case_risk_score(row):
-                # "🟡 45"와 같은 문자열에서 숫자만 추출
-                m = re.search(r"(\d+)", row[risk_idx])
-                return int(m.group(1)) if m else 0
-            case_rows.sort(key=get_case_risk_score, reverse=True)
-
-        no_idx = case_header_cols.index("No.") if "No." in case_header_cols else None
+        case_col = _column_index(case_header_cols)
+        risk_idx = case_col.get("위험도⬇️")
+        if risk_idx is not None:
+            case_rows.sort(key=lambda row: _risk_score(row[risk_idx]), reverse=True)
+
+        no_idx = case_col.get("No.")
         for i, row_data in enumerate(case_rows, 1):
             row = list(row_data)
             if no_idx is not None:
@@ -1,10 +1,15 @@
 from __future__ import annotations
+import os
 import re
 import requests
 import yaml
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Dict, Any, Set, Tuple
 from datetime import datetime, timezone, timedelta
 from .utils import debug_log
 
@@ -13,6 +18,37 @@ CASE_NO_PATTERNS = [
     re.compile(r"\b\d{1,2}:\d{2}-cv-\d{5}\b", re.IGNORECASE),
     re.compile(r"\b\d{4}-cv-\d{4,6}\b", re.IGNORECASE),
 ]
+# 기사 제목 끝의 " - 매체명" 접미사
+_PUBLISHER_SUFFIX_RE = re.compile(r"\s+[-|–|—]\s+[^-–—|]{2,}$")
+# "A v. B" / "A vs. B" / "A v B"
+_AVB_RE = re.compile(r"([A-Z][A-Za-z0-9 ,.&'\-]{2,})\s+v\.?s?\.?\s+([A-Z][A-Za-z0-9 ,.&'\-]{2,})")
+# 본문 사건명 후보 (흔한 변형: v, v., vs, vs.)
+_CASE_TITLE_RE = re.compile(
+    r"([A-Z][A-Za-z0-9 ,.&'\-]{2,}?)\s+v\.?s?\.?\s+([A-Z][A-Za-z0-9 ,.&'\-]{2,}?)\b"
+)
+# 사건명 점수용 법률 문맥 키워드 (lookahead라 "incorporated"의 inc/corp처럼 겹쳐도 모두 잡힌다)
+_LEGAL_KW_RE = re.compile(
+    r"(?=(et al|inc|llc|ltd|pbc|corp|company|microsoft|openai|anthropic|google|meta|nvidia|amazon|times))"
+)
+# 기사 본문 공백 정리
+_HSPACE_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# 살펴볼 최대 후보 수 / 이 점수 이상이면 더 찾지 않음
+CASE_TITLE_MAX_CANDIDATES = 20
+CASE_TITLE_GOOD_SCORE = 2.5
+
+# 기사 본문 병렬 수집 스레드 수 (네트워크 대기 위주)
+NEWS_FETCH_THREADS = int(os.getenv("NEWS_FETCH_THREADS", "20"))
+
+# 기사 수집용 공유 세션: 같은 매체/리다이렉트 호스트로의 커넥션을 재사용
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=max(64, NEWS_FETCH_THREADS),
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 @dataclass
 class Lawsuit:
@@ -34,15 +70,16 @@ def fetch_page_text(url: str, timeout: int = 15) -> tuple[str, str]:
     - 네트워크/차단 등의 이유로 실패할 수 있으므로 예외는 삼키고 빈 값 반환.
     """
     try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"}, allow_redirects=True)
+        r = _SESSION.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"}, allow_redirects=True)
         r.raise_for_status()
         final_url = (r.url or url).strip()
-        soup = BeautifulSoup(r.text, "lxml")
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-        text = soup.get_text("\n")
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        # C 기반 lexbor 파서: 병렬 수집 이후 병목이 되는 HTML 파싱 비용을 줄인다
+        tree = LexborHTMLParser(r.text)
+        for node in tree.css("script, style, noscript"):
+            node.decompose()
+        text = tree.root.text(separator="\n") if tree.root else ""
+        text = _HSPACE_RE.sub(" ", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         return text[:20000], final_url
     except Exception as e:
         debug_log(f"fetch_page_text failed: {url}, error: {e}")
@@ -55,12 +92,19 @@ def load_known_cases(path: str = "data/known_cases.yml") -> List[Dict[str, Any]]
     except FileNotFoundError:
         return []
 
-def enrich_from_known(text: str, title: str, known: List[Dict[str, Any]]) -> Dict[str, str]:
-    hay = (title + "\n" + text).lower()
+def compile_known_cases(known: List[Dict[str, Any]]) -> List[Tuple[re.Pattern, Dict[str, str]]]:
+    """known_cases 항목별 match.any 용어를 하나의 정규식으로 미리 컴파일한다 (항목 순서 = 우선순위)."""
+    rules = []
     for entry in known:
-        any_terms = [t.lower() for t in entry.get("match", {}).get("any", [])]
-        if any_terms and any(term in hay for term in any_terms):
-            return entry.get("enrich", {}) or {}
+        any_terms = [t for t in entry.get("match", {}).get("any", []) if t]
+        if any_terms:
+            rules.append((_kw(*any_terms), entry.get("enrich", {}) or {}))
+    return rules
+
+def enrich_from_known(text: str, title: str, known_rules: List[Tuple[re.Pattern, Dict[str, str]]]) -> Dict[str, str]:
+    for pat, enrich in known_rules:
+        if pat.search(title) or pat.search(text):
+            return enrich
     return {}
 
 def extract_case_number(text: str) -> str:
@@ -79,17 +123,16 @@ def extract_case_title_from_text(text: str) -> str:
     오탐을 줄이기 위해:
     - 너무 짧은 캡션/문장 제외
     - 후보가 여러 개면 길이/키워드 점수로 최적 1개 선택
+      (앞쪽 후보 CASE_TITLE_MAX_CANDIDATES개까지, 점수가 충분하면 바로 확정)
     """
     t = (text or "")[:20000]
     if not t:
         return "미확인"
 
-    # 흔한 변형: v, v., vs, vs.
-    pat = re.compile(
-        r"([A-Z][A-Za-z0-9 ,.&'\-]{2,}?)\s+v\.?s?\.?\s+([A-Z][A-Za-z0-9 ,.&'\-]{2,}?)\b"
-    )
-    cands = []
-    for m in pat.finditer(t):
+    # 앞쪽 후보 몇 개만 보고, 법률 문맥 점수가 충분한 후보가 나오면 바로 멈춘다
+    best = ""
+    best_score = -1.0
+    for m in islice(_CASE_TITLE_RE.finditer(t), CASE_TITLE_MAX_CANDIDATES):
         a = m.group(1).strip(" ,.;:-")
         b = m.group(2).strip(" ,.;:-")
         # 너무 긴 문자열/광고 문구 등 제외
@@ -98,24 +141,21 @@ def extract_case_title_from_text(text: str) -> str:
         if len(a) > 80 or len(b) > 80:
             continue
         cand = f"{a} v. {b}"
-        cands.append(cand)
+        sc = _case_title_score(cand)
+        if sc > best_score:
+            best, best_score = cand, sc
+        if sc >= CASE_TITLE_GOOD_SCORE:
+            break
 
-    if not cands:
-        return "미확인"
+    return best or "미확인"
 
-    # 간단 스코어링: 'et al' / 'Inc' / 'LLC' / 'PBC' 등 법률 문맥 가점
-    def score(x: str) -> float:
-        xl = x.lower()
-        bonus = 0.0
-        for kw in ["et al", "inc", "llc", "ltd", "pbc", "corp", "company", "microsoft", "openai", "anthropic", "google", "meta", "nvidia", "amazon", "times"]:
-            if kw in xl:
-                bonus += 0.2
-        # 너무 짧으면 감점
-        base = min(len(x) / 40.0, 2.0)
-        return base + bonus
 
-    best = max(cands, key=score)
-    return best
+def _case_title_score(x: str) -> float:
+    # 간단 스코어링: 'et al' / 'Inc' / 'LLC' / 'PBC' 등 법률 문맥 가점 (키워드당 1회)
+    bonus = 0.2 * len({m.group(1) for m in _LEGAL_KW_RE.finditer(x.lower())})
+    # 너무 짧으면 감점
+    base = min(len(x) / 40.0, 2.0)
+    return base + bonus
 
 
 def guess_case_title_from_article_title(title: str) -> str:
@@ -129,36 +169,49 @@ def guess_case_title_from_article_title(title: str) -> str:
         return "미확인"
 
     # 흔한 기사 접미사(" - 매체명" 등) 제거
-    t = re.sub(r"\s+[-|–|—]\s+[^-–—|]{2,}$", "", t).strip()
+    t = _PUBLISHER_SUFFIX_RE.sub("", t).strip()
 
     # A v. B 패턴
-    m = re.search(r"([A-Z][A-Za-z0-9 ,.&'\-]{2,})\s+v\.?s?\.?\s+([A-Z][A-Za-z0-9 ,.&'\-]{2,})", t)
+    m = _AVB_RE.search(t)
     if m:
         return f"{m.group(1).strip()} v. {m.group(2).strip()}"
 
     return "미확인"
 
-def reason_heuristic(hay: str) -> str:
-    h = hay.lower()
-    # 1. 특정 서비스/플랫폼/데이터 기반
-    if "shadow library" in h or "pirat" in h or "books3" in h:
-        return "불법 유통본/해적판(Books3 등) 등으로 추정되는 데이터셋을 AI 모델 학습에 활용한 것에 따른 저작권 침해 주장."
-    if "youtube" in h:
-        return "유튜브 콘텐츠를 무단 수집(Scraping)하여 AI 학습에 사용하고, 서비스 약관 및 기술적 보호조치를 위반했다는 주장."
-    if "lyrics" in h or "music publisher" in h or "musical works" in h:
-        return "저작물인 음악 가사 및 곡 정보를 무단으로 학습에 사용하여 권리자의 저작권을 침해했다는 주장."
-    if "news" in h and ("publisher" in h or "journalism" in h):
-        return "언론사의 기사 콘텐츠를 데이터 학습에 무단 활용하여 저작권 및 상업적 가치를 훼손했다는 주장."
-    if "artist" in h and ("style" in h or "artwork" in h):
-        return "예술가의 작품을 무단 학습하여 스타일을 모방하거나 저작권을 부당하게 이용했다는 주장."
-    if "trade secret" in h or "confidential" in h:
-        return "기업의 영업비밀에 해당하는 데이터를 무단 취득하여 AI 모델 개발 등에 활용했다는 의혹."
-    if any(k in h for k in ["contract", "licensing", "agreement", "partnership", "계약", "협력", "제휴"]):
-        return "AI 학습용 데이터 공급 계약 또는 제휴 협력과 관련된 소식이며, 권리 관계 및 계약 조건 등이 주요 쟁점입니다."
+def _kw(*keywords: str) -> re.Pattern:
+    """키워드 중 하나라도 포함되면 매칭 (대소문자 무시)"""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
 
+# reason_heuristic 규칙: (모두 매칭되어야 하는 패턴들, 사유) — 위에서부터 우선 적용
+_REASON_RULES = [
+    # 1. 특정 서비스/플랫폼/데이터 기반
+    ((_kw("shadow library", "pirat", "books3"),),
+     "불법 유통본/해적판(Books3 등) 등으로 추정되는 데이터셋을 AI 모델 학습에 활용한 것에 따른 저작권 침해 주장."),
+    ((_kw("youtube"),),
+     "유튜브 콘텐츠를 무단 수집(Scraping)하여 AI 학습에 사용하고, 서비스 약관 및 기술적 보호조치를 위반했다는 주장."),
+    ((_kw("lyrics", "music publisher", "musical works"),),
+     "저작물인 음악 가사 및 곡 정보를 무단으로 학습에 사용하여 권리자의 저작권을 침해했다는 주장."),
+    ((_kw("news"), _kw("publisher", "journalism")),
+     "언론사의 기사 콘텐츠를 데이터 학습에 무단 활용하여 저작권 및 상업적 가치를 훼손했다는 주장."),
+    ((_kw("artist"), _kw("style", "artwork")),
+     "예술가의 작품을 무단 학습하여 스타일을 모방하거나 저작권을 부당하게 이용했다는 주장."),
+    ((_kw("trade secret", "confidential"),),
+     "기업의 영업비밀에 해당하는 데이터를 무단 취득하여 AI 모델 개발 등에 활용했다는 의혹."),
+    ((_kw("contract", "licensing", "agreement", "partnership", "계약", "협력", "제휴"),),
+     "AI 학습용 데이터 공급 계약 또는 제휴 협력과 관련된 소식이며, 권리 관계 및 계약 조건 등이 주요 쟁점입니다."),
     # 2. 일반적인 AI 학습 관련 (Keywords based)
-    if any(k in h for k in ["training data", "ai training", "model training"]):
-        return "AI 모델 학습을 위해 허가되지 않은 데이터를 대량으로 수집하여 저작권 및 관련 법규를 위반했다는 취지의 소송."
+    ((_kw("training data", "ai training", "model training"),),
+     "AI 모델 학습을 위해 허가되지 않은 데이터를 대량으로 수집하여 저작권 및 관련 법규를 위반했다는 취지의 소송."),
+]
+
+# 기사 관련성 1차 필터 키워드
+_RELEVANCE_RE = _kw("lawsuit", "sued", "litigation", "copyright", "dmca", "pirat", "unauthoriz", "training data", "dataset")
+
+def reason_heuristic(hay: str) -> str:
+    # 규칙별 정규식은 IGNORECASE로 미리 컴파일되어 있어 hay.lower() 사본이 필요 없다
+    for patterns, reason in _REASON_RULES:
+        if all(p.search(hay) for p in patterns):
+            return reason
 
     return "AI 모델 학습 및 서비스 개발 과정에서의 무단 데이터 수집 및 저작권 침해 관련 분쟁."
 
@@ -166,20 +219,23 @@ def build_lawsuits_from_news(news_items, known_cases, lookback_days: int = 3) ->
     results: List[Lawsuit] = []
     debug_log(f"build_lawsuits_from_news items={len(news_items)} lookback={lookback_days}")
     cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
-    for item in news_items:
-        if item.published_at and item.published_at < cutoff:
-            continue
-        text, final_url = fetch_page_text(item.url)
+    items = [it for it in news_items if not (it.published_at and it.published_at < cutoff)]
+    known_rules = compile_known_cases(known_cases)
+
+    # 기사 본문 수집은 I/O 대기가 대부분이므로 병렬로 받고, 이후 분석은 순서대로 처리
+    with ThreadPoolExecutor(max_workers=max(1, min(NEWS_FETCH_THREADS, len(items)))) as ex:
+        fetched = list(ex.map(lambda it: fetch_page_text(it.url), items))
+
+    for item, (text, final_url) in zip(items, fetched):
         if not text:
             continue
 
         hay = (item.title + " " + text)
-        lower = hay.lower()
-        if not any(k in lower for k in ["lawsuit", "sued", "litigation", "copyright", "dmca", "pirat", "unauthoriz", "training data", "dataset"]):
-            debug_log(f"Skipped non-relevant news: {item.title[:60]}...")
+        if not _RELEVANCE_RE.search(hay):
+            debug_log("Skipped non-relevant news: %.60s...", item.title)
             continue
 
-        enrich = enrich_from_known(text, item.title, known_cases)
+        enrich = enrich_from_known(text, item.title, known_rules)
 
         # 1) 본문에서 소송번호/사건명 추출 (가장 정확)
         case_number = enrich.get("case_number") or extract_case_number(text)
@@ -198,20 +254,25 @@ def build_lawsuits_from_news(news_items, known_cases, lookback_days: int = 3) ->
                 article_title=article_title,
                 case_number=case_number,
                 reason=enrich.get("reason", reason_heuristic(hay)),
-                article_urls=sorted(list({final_url, item.url})),
+                article_urls=[final_url, item.url],
             )
         )
 
     # 병합
     merged: Dict[tuple[str, str, str], Lawsuit] = {}
+    # 병합 중에는 URL을 set으로 모으고, 정렬은 마지막에 한 번만 한다
+    url_sets: Dict[tuple[str, str, str], Set[str]] = {}
     for r in results:
         # 사건번호가 없는 경우도 있어 (case_number, case_title, article_title)로 최대한 보존
         key = (r.case_number, r.case_title, r.article_title)
         if key not in merged:
             merged[key] = r
+            url_sets[key] = set(r.article_urls)
         else:
-            merged[key].article_urls = sorted(list(set(merged[key].article_urls + r.article_urls)))
+            url_sets[key].update(r.article_urls)
             if r.update_or_filed_date > merged[key].update_or_filed_date:
                 merged[key].update_or_filed_date = r.update_or_filed_date
 
+    for key, r in merged.items():
+        r.article_urls = sorted(url_sets[key])
     return list(merged.values())
\ No newline at end of file
@@ -1,23 +1,150 @@
 from __future__ import annotations
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
 import requests
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from .dedup import generate_consolidated_report
 
-def _headers(token: str) -> Dict[str, str]:
-    return {
+# 이전 날짜 이슈 정리 병렬도 (세션 pool_maxsize 이하로 유지)
+CLOSE_ISSUE_THREADS = 8
+
+# api.github.com 호출 공유 세션: 호출마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션을 재사용
+# POST(댓글/이슈 생성)는 중복 생성 위험이 있어 자동 재시도하지 않는다
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "PATCH"}),
+        raise_on_status=False,
+    ),
+))
+
+# 토큰은 실행 중 바뀌지 않으므로 헤더를 한 번만 만들고 읽기 전용으로 공유
+@lru_cache(maxsize=4)
+def _headers(token: str) -> Mapping[str, str]:
+    return MappingProxyType({
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
-    }
+    })
 
-def find_or_create_issue(owner: str, repo: str, token: str, title: str, label: str) -> int:
-    url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-    r = requests.get(url, headers=_headers(token), params={"state": "open", "labels": label, "per_page": 50}, timeout=20)
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# 목록 조회 응답(ETag + 본문)을 실행 간 보관: 변경이 없으면 304로 본문 전송/파싱과 rate limit 소모를 피한다
+GH_ETAG_CACHE_DIR = os.path.join(os.getenv("CL_CACHE_DIR", ".cache"), "github")
+
+def _etag_cache_path(url: str, params: Optional[dict], token: str) -> str:
+    # 응답은 인증 주체별로 달라질 수 있어(Vary: Authorization) 토큰 해시도 키에 포함
+    raw = json.dumps([url, sorted((params or {}).items()), hashlib.sha1(token.encode("utf-8")).hexdigest()])
+    return os.path.join(GH_ETAG_CACHE_DIR, hashlib.sha1(raw.encode("utf-8")).hexdigest() + ".json")
+
+def _get_cached(url: str, token: str, params: Optional[dict] = None) -> Any:
+    """If-None-Match 조건부 GET. 304면 저장해 둔 본문을, 아니면 새 본문을 저장 후 반환한다."""
+    path = _etag_cache_path(url, params, token)
+    cached = None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    headers = _headers(token)
+    if cached and cached.get("etag"):
+        headers = {**headers, "If-None-Match": cached["etag"]}
+    r = _SESSION.get(url, headers=headers, params=params, timeout=20)
+    if r.status_code == 304 and cached:
+        return cached["body"]
     r.raise_for_status()
-    issues = r.json()
+    body = r.json()
+
+    etag = r.headers.get("ETag")
+    if etag:
+        try:
+            os.makedirs(GH_ETAG_CACHE_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "body": body}, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return body
+
+# 한 실행 안에서 같은 목록을 여러 번 조회하지 않도록 읽기 결과를 짧게 메모 (쓰기 시 무효화)
+GH_MEMO_TTL_SEC = 60
+_memo: Dict[Tuple, Tuple[float, Any]] = {}
+_memo_lock = threading.Lock()
+
+def _memoized(key: Tuple, load: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    with _memo_lock:
+        hit = _memo.get(key)
+    if hit and now - hit[0] < GH_MEMO_TTL_SEC:
+        return hit[1]
+    value = load()
+    with _memo_lock:
+        _memo[key] = (now, value)
+    return value
+
+def _invalidate(*prefix: Any) -> None:
+    """prefix로 시작하는 메모 키를 모두 지운다 (예: ("issues", owner, repo))."""
+    n = len(prefix)
+    with _memo_lock:
+        for key in [k for k in _memo if k[:n] == prefix]:
+            del _memo[key]
+
+def _remember_no_comments(owner: str, repo: str, issue_number: int) -> None:
+    """댓글이 0건임이 확실한 이슈는 list_comments가 요청 없이 []를 돌려주도록 메모해 둔다."""
+    with _memo_lock:
+        _memo[("comments", owner, repo, issue_number)] = (time.monotonic(), [])
+
+def _search_open_issue_by_title(owner: str, repo: str, token: str, title: str, label: str) -> Optional[int]:
+    """Search API로 제목이 정확히 일치하는 OPEN 이슈 번호를 찾는다. 실패/미발견이면 None."""
+    q = f'repo:{owner}/{repo} is:issue is:open in:title label:"{label}" "{title}"'
+    try:
+        r = _SESSION.get("https://api.github.com/search/issues", headers=_headers(token), params={"q": q, "per_page": 5}, timeout=20)
+        if r.status_code != 200:
+            return None
+        items = r.json().get("items") or []
+    except Exception:
+        return None
+    # in:title 검색은 부분 일치이므로 제목을 다시 정확히 비교
+    for it in items:
+        if it.get("title") == title:
+            return int(it["number"])
+    return None
+
+def find_open_issue(owner: str, repo: str, token: str, title: str, label: str) -> Optional[int]:
+    """제목이 정확히 일치하는 OPEN 이슈 번호 (읽기 전용 조회, 없으면 None)."""
+    found = _search_open_issue_by_title(owner, repo, token, title, label)
+    if found:
+        return found
+    # 검색 인덱스는 방금 만든 이슈를 늦게 반영할 수 있어 라벨 목록도 확인한다
+    # (close_other_daily_issues와 같은 목록이라 메모된 결과를 공유)
+    issues = list_open_issues_by_label(owner, repo, token, label)
     for it in issues:
         if it.get("title") == title:
             return int(it["number"])
+    return None
+
+def find_or_create_issue(owner: str, repo: str, token: str, title: str, label: str) -> int:
+    found = find_open_issue(owner, repo, token, title, label)
+    if found:
+        return found
+    url = f"https://api.github.com/repos/{owner}/{repo}/issues"
     payload = {
         "title": title,
         "body": (
@@ -57,25 +184,39 @@ def find_or_create_issue(owner: str, repo: str, token: str, title: str, label: s
         ),
         "labels": [label]
     }    
-    r2 = requests.post(url, headers=_headers(token), json=payload, timeout=20)
+    r2 = _SESSION.post(url, headers=_headers(token), json=payload, timeout=20)
     r2.raise_for_status()
-    return int(r2.json()["number"])
+    _invalidate("issues", owner, repo, label)
+    number = int(r2.json()["number"])
+    # 방금 만든 이슈에는 댓글이 없다
+    _remember_no_comments(owner, repo, number)
+    return number
 
 def create_comment(owner: str, repo: str, token: str, issue_number: int, body: str) -> None:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    r = requests.post(url, headers=_headers(token), json={"body": body}, timeout=20)
+    r = _SESSION.post(url, headers=_headers(token), json={"body": body}, timeout=20)
     r.raise_for_status()
+    _invalidate("comments", owner, repo, issue_number)
 
 def list_open_issues_by_label(owner: str, repo: str, token: str, label: str, per_page: int = 100) -> list[dict]:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-    r = requests.get(url, headers=_headers(token), params={"state": "open", "labels": label, "per_page": per_page}, timeout=20)
-    r.raise_for_status()
-    return r.json() or []
+
+    def load() -> list[dict]:
+        issues = _get_cached(url, token, {"state": "open", "labels": label, "per_page": per_page}) or []
+        # 목록 응답에 댓글 수가 함께 오므로 0건인 이슈는 이후 댓글 목록 조회를 생략
+        # (검색 API의 댓글 수는 인덱스 지연이 있어 여기서만 사용)
+        for it in issues:
+            if it.get("comments") == 0 and it.get("number") is not None:
+                _remember_no_comments(owner, repo, int(it["number"]))
+        return issues
+
+    return _memoized(("issues", owner, repo, label), load)
 
 def close_issue(owner: str, repo: str, token: str, issue_number: int) -> None:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}"
-    r = requests.patch(url, headers=_headers(token), json={"state": "closed"}, timeout=20)
+    r = _SESSION.patch(url, headers=_headers(token), json={"state": "closed"}, timeout=20)
     r.raise_for_status()
+    _invalidate("issues", owner, repo)
 
 def close_other_daily_issues(owner: str, repo: str, token: str, label: str, base_title: str, today_title: str, new_issue_number: int, new_issue_url: str) -> list[int]:
     """같은 라벨을 가진 모니터링 이슈 중 '오늘/현재' 이슈를 제외한 나머지 OPEN 이슈를 닫습니다."""
@@ -89,37 +230,146 @@ def close_other_daily_issues(owner: str, repo: str, token: str, label: str, base
         "이 이슈는 다음 리포트 생성으로 자동 종료되었습니다."
     )
 
+    targets: list[tuple[int, str]] = []
     for it in issues:
         t = it.get("title") or ""
         if t == today_title:
             continue
         # base_title (YYYY-MM-DD) 형태만 닫기
         if t.startswith(prefix) and t.endswith(")"):
-            num = int(it["number"])
-            
-            # [추가] 이슈를 닫기 전에 모든 댓글을 취합하여 통합 리포트 작성
-            try:
-                comments = list_comments(owner, repo, token, num)
-                consolidated_report = generate_consolidated_report(comments)
-                final_body = (
-                    f"{consolidated_report}\n\n"
-                    f"---\n\n"
-                    f"{footer}"
-                )
-            except Exception as e:
-                import sys
-                print(f"Error generating consolidated report for issue #{num}: {e}", file=sys.stderr)
-                final_body = footer
-
-            comment_and_close_issue(owner, repo, token, num, final_body)
-            closed.append(num)
+            targets.append((int(it["number"]), it.get("node_id") or ""))
+    if not targets:
+        return closed
+
+    def _final_body(num: int) -> str:
+        # [추가] 이슈를 닫기 전에 모든 댓글을 취합하여 통합 리포트 작성
+        try:
+            comments = list_comments(owner, repo, token, num)
+            consolidated_report = generate_consolidated_report(comments)
+            return (
+                f"{consolidated_report}\n\n"
+                f"---\n\n"
+                f"{footer}"
+            )
+        except Exception as e:
+            print(f"Error generating consolidated report for issue #{num}: {e}", file=sys.stderr)
+            return footer
+
+    # 이슈별 댓글 조회/통합 리포트 작성은 서로 독립적이므로 병렬로 처리 (원래 순서 유지)
+    nums = [num for num, _ in targets]
+    with ThreadPoolExecutor(max_workers=min(CLOSE_ISSUE_THREADS, len(nums))) as ex:
+        bodies = list(ex.map(_final_body, nums))
+
+    # 댓글+Close는 GraphQL 한 번으로 묶고, 처리되지 않은 이슈만 REST로 마무리
+    commented = _comment_and_close_batch(token, [(node_id, body) for (_, node_id), body in zip(targets, bodies)])
+    _invalidate("issues", owner, repo)
+
+    def _finish_rest(i: int) -> int:
+        num = nums[i]
+        state = commented[i]
+        if state == "closed":
+            _invalidate("comments", owner, repo, num)
+        elif state == "commented":
+            _invalidate("comments", owner, repo, num)
+            close_issue(owner, repo, token, num)
+        elif state == "unknown":
+            # GraphQL이 이미 적용됐을 수 있으므로 중복 댓글이 달리지 않게 현재 상태부터 확인
+            _invalidate("comments", owner, repo, num)
+            if _issue_state(owner, repo, token, num) == "closed":
+                return num
+            if any(c.get("body") == bodies[i] for c in list_comments(owner, repo, token, num)):
+                close_issue(owner, repo, token, num)
+            else:
+                comment_and_close_issue(owner, repo, token, num, bodies[i])
+        else:
+            comment_and_close_issue(owner, repo, token, num, bodies[i])
+        return num
+
+    with ThreadPoolExecutor(max_workers=min(CLOSE_ISSUE_THREADS, len(nums))) as ex:
+        closed.extend(ex.map(_finish_rest, range(len(nums))))
     return closed
 
+def _issue_state(owner: str, repo: str, token: str, issue_number: int) -> str:
+    """이슈의 현재 state("open"/"closed")를 캐시 없이 조회한다."""
+    url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}"
+    r = _SESSION.get(url, headers=_headers(token), timeout=20)
+    r.raise_for_status()
+    return r.json().get("state") or ""
+
+def _graphql(token: str, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    r = _SESSION.post(GRAPHQL_URL, headers=_headers(token), json={"query": query, "variables": variables}, timeout=30)
+    r.raise_for_status()
+    return r.json() or {}
+
+def _comment_and_close_batch(token: str, targets: List[Tuple[str, str]]) -> List[str]:
+    """(node_id, 본문) 목록을 aliased mutation 하나로 댓글 작성 후 Close 한다.
+
+    항목별 결과: "closed"(둘 다 성공) / "commented"(댓글만 성공) / ""(처리 안 됨 → REST로 재시도)
+    / "unknown"(요청이 서버에 닿았는지 불확실 → 이슈 상태/댓글 확인 후 필요한 것만 재시도).
+    """
+    states = [""] * len(targets)
+    idx = [i for i, (node_id, _) in enumerate(targets) if node_id]
+    if not idx:
+        return states
+
+    params, fields, variables = [], [], {}
+    for i in idx:
+        node_id, body = targets[i]
+        params.append(f"$id{i}: ID!, $body{i}: String!")
+        # 같은 문서 안의 mutation 필드는 순서대로 실행되므로 댓글 → Close 순서가 보장된다
+        fields.append(
+            f"c{i}: addComment(input: {{subjectId: $id{i}, body: $body{i}}}) {{ clientMutationId }}\n"
+            f"x{i}: closeIssue(input: {{issueId: $id{i}}}) {{ clientMutationId }}"
+        )
+        variables[f"id{i}"] = node_id
+        variables[f"body{i}"] = body
+    query = f"mutation({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}"
+
+    try:
+        payload = _graphql(token, query, variables)
+    except Exception as e:
+        # 요청이 서버에 전혀 전달되지 않은 것이 확실한 경우(연결 수립 실패)나 4xx만 REST로 그대로 재시도.
+        # 전송 후 끊김/읽기 타임아웃/5xx/응답 파싱 실패는 이미 적용됐을 수 있으므로 이슈 상태를 확인한 뒤 처리한다.
+        if _never_sent(e):
+            print(f"GraphQL batch close failed, falling back to REST: {e}", file=sys.stderr)
+            return states
+        print(f"GraphQL batch close result unknown, checking issues before retry: {e}", file=sys.stderr)
+        for i in idx:
+            states[i] = "unknown"
+        return states
+
+    # 200이어도 최상위 errors와 함께 data가 비어 올 수 있다(서버 측 타임아웃 등) → 결과가 없는 항목은 확인 대상
+    data = payload.get("data") or {}
+    errors = payload.get("errors")
+    if errors:
+        print(f"GraphQL batch close returned errors: {errors}", file=sys.stderr)
+    for i in idx:
+        if data.get(f"c{i}") is not None:
+            states[i] = "closed" if data.get(f"x{i}") is not None else "commented"
+        elif errors:
+            states[i] = "unknown"
+    return states
+
+def _never_sent(e: Exception) -> bool:
+    """요청 본문이 서버에 도달하지 않았음이 확실한 예외인지 (연결 수립 실패 또는 4xx 거부)."""
+    if isinstance(e, requests.HTTPError):
+        resp = e.response
+        return resp is not None and 400 <= resp.status_code < 500
+    if isinstance(e, (requests.ConnectTimeout, requests.exceptions.SSLError)):
+        return True
+    if isinstance(e, requests.ConnectionError) and e.args:
+        # "Connection aborted"/RemoteDisconnected 등은 전송 후 끊긴 것이므로 제외하고,
+        # 새 연결을 만들지 못한 경우(DNS 실패/연결 거부/연결 타임아웃)만 인정한다
+        reason = getattr(e.args[0], "reason", e.args[0])
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
 def comment_and_close_issue(owner: str, repo: str, token: str, issue_number: int, body: str) -> None:
     # 먼저 마무리 코멘트 작성
     url_c = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    rc = requests.post(url_c, headers=_headers(token), json={"body": body}, timeout=20)
+    rc = _SESSION.post(url_c, headers=_headers(token), json={"body": body}, timeout=20)
     rc.raise_for_status()
+    _invalidate("comments", owner, repo, issue_number)
     # 그 다음 이슈 Close
     close_issue(owner, repo, token, issue_number)
 
@@ -131,9 +381,7 @@ def comment_and_close_issue(owner: str, repo: str, token: str, issue_number: int
 # =========================================================
 def list_comments(owner: str, repo: str, token: str, issue_number: int) -> list[dict]:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    r = requests.get(url, headers=_headers(token), timeout=20)
-    r.raise_for_status()
-    return r.json() or []
+    return _memoized(("comments", owner, repo, issue_number), lambda: _get_cached(url, token) or [])
 
 
 
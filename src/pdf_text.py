@@ -1,15 +1,124 @@
 from __future__ import annotations
+import hashlib
+import os
+import tempfile
+import time
+from functools import lru_cache
 from io import BytesIO
-from typing import Optional
+from typing import Dict, Mapping, Optional
 import requests
 from pypdf import PdfReader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def extract_pdf_text(url: str, max_chars: int = 6000, timeout: int = 30) -> str:
+# 같은 소장 PDF가 RECAP/HTML fallback 경로로 한 실행에서 여러 번 요청되므로
+# URL 단위로 이 길이만큼 한 번 추출해 두고 호출마다 잘라서 반환한다
+PDF_TEXT_CACHE_CHARS = 6000
+
+# 실행 간 재사용하는 추출 텍스트 캐시: 원격 ETag/Last-Modified가 같으면 다운로드/파싱 생략
+PDF_TEXT_CACHE_DIR = os.path.join(os.getenv("CL_CACHE_DIR", ".cache"), "pdf_text")
+# 이 기간 동안 읽히지 않은 캐시 파일은 실행 시작 시 삭제 (CI 캐시가 실행마다 누적되지 않도록)
+PDF_TEXT_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# 호출 측이 이미 검증한 HEAD 응답 헤더 (URL → 헤더): 지문용 HEAD를 다시 보내지 않는다
+_known_heads: Dict[str, Mapping[str, str]] = {}
+
+# PDF HEAD/GET 공유 세션: storage.courtlistener.com 등 같은 호스트로의 TLS 연결을 재사용
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers["User-Agent"] = "Mozilla/5.0"
+
+class _EmptyText(Exception):
+    """추출 실패(빈 텍스트)를 lru_cache에 남기지 않기 위한 예외"""
+
+def extract_pdf_text(url: str, max_chars: int = 6000, timeout: int = 30, head: Optional[Mapping[str, str]] = None) -> str:
     """PDF 텍스트 추출(가벼운 형태).
     - 스캔 PDF(이미지)면 텍스트가 거의 없을 수 있음.
+    - head: 호출 측이 이미 받은 HEAD 응답 헤더 (있으면 디스크 캐시 지문에 재사용)
     """
+    if head is not None:
+        _known_heads[url] = head
+    if max_chars <= PDF_TEXT_CACHE_CHARS:
+        try:
+            return _extract_pdf_text_cached(url, timeout)[:max_chars]
+        except _EmptyText:
+            return ""
+    return _extract_pdf_text(url, max_chars, timeout)
+
+@lru_cache(maxsize=512)
+def _extract_pdf_text_cached(url: str, timeout: int) -> str:
+    path = _disk_cache_path(url)
+    if path and os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            # 읽힌 파일은 수정 시각을 갱신해 오래된 파일 정리 대상에서 빠지게 한다
+            os.utime(path)
+            return text
+        except OSError:
+            pass
+
+    text = _extract_pdf_text(url, PDF_TEXT_CACHE_CHARS, timeout)
+    # 실패(빈 텍스트)는 디스크/메모리 어디에도 저장하지 않아 다음 호출에서 다시 시도한다
+    if not text:
+        raise _EmptyText(url)
+    if path:
+        try:
+            os.makedirs(PDF_TEXT_CACHE_DIR, exist_ok=True)
+            # 같은 URL을 여러 스레드가 동시에 추출할 수 있으므로 임시 파일 이름은 호출마다 고유해야 한다
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=PDF_TEXT_CACHE_DIR, suffix=".tmp", delete=False
+            ) as f:
+                f.write(text)
+            os.replace(f.name, path)
+        except OSError:
+            pass
+    return text
+
+def _disk_cache_path(url: str) -> Optional[str]:
+    """HEAD 응답의 ETag/Last-Modified로 캐시 파일 경로를 만든다. 지문이 없으면 None."""
+    head = _known_heads.get(url)
+    if head is None:
+        try:
+            h = _SESSION.head(url, timeout=5, allow_redirects=True)
+        except Exception:
+            return None
+        if h.status_code != 200:
+            return None
+        head = h.headers
+    etag = head.get("ETag", "")
+    modified = head.get("Last-Modified", "")
+    if not (etag or modified):
+        return None
+    fingerprint = "\n".join((url, etag, modified, head.get("Content-Length", "")))
+    key = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+    return os.path.join(PDF_TEXT_CACHE_DIR, f"{key}.txt")
+
+def _prune_disk_cache() -> None:
+    """PDF_TEXT_CACHE_MAX_AGE 동안 쓰이지 않은 캐시 파일(중단된 임시 파일 포함)을 지운다."""
+    cutoff = time.time() - PDF_TEXT_CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(PDF_TEXT_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+_prune_disk_cache()
+
+def _extract_pdf_text(url: str, max_chars: int, timeout: int) -> str:
     try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"})
+        r = _SESSION.get(url, timeout=timeout)
         r.raise_for_status()
         bio = BytesIO(r.content)
         reader = PdfReader(bio)
@@ -1,19 +1,23 @@
 from __future__ import annotations
+import heapq
+import io
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 from .fetch import fetch_news
 from .extract import load_known_cases, build_lawsuits_from_news
 from .render import render_markdown
-from .github_issue import find_or_create_issue, create_comment, close_other_daily_issues
+from .github_issue import find_open_issue, find_or_create_issue, create_comment, close_other_daily_issues
 from .github_issue import list_comments
 from .slack import post_to_slack
 from .utils import debug_log, slugify_case_name
 from .dedup import apply_deduplication
 from .courtlistener import (
-    search_recent_documents,
+    search_recent_documents_many,
     build_complaint_documents_from_hits,
     build_case_summaries_from_hits,
     build_case_summaries_from_docket_numbers,
@@ -22,6 +26,52 @@ from .courtlistener import (
 )
 from .queries import COURTLISTENER_QUERIES
 
+_KST = ZoneInfo("Asia/Seoul")
+
+
+def _slack_dedup_line(base: int, dup: int, new: int) -> str:
+    # New 수치가 0보다 크면 강조 (Bolding + 🔴)
+    new_label = f"*{new} (New)*" + (" :red_circle:" if new > 0 else "")
+    return f"{base} (Baseline): {dup} (Dup), {new_label}"
+
+
+def _collect_courtlistener(lookback_days: int) -> tuple[list, list]:
+    """CourtListener 검색 → hit 중복 제거 → Complaint 문서/도켓 요약."""
+    # 쿼리끼리 독립적이므로 병렬 실행, 결과는 쿼리 순서대로 합침
+    debug_log("Running %d CourtListener queries concurrently", len(COURTLISTENER_QUERIES))
+    hits = search_recent_documents_many(COURTLISTENER_QUERIES, days=lookback_days, max_results=20)
+
+    # 중복 제거 (URL, 케이스명) 튜플 키 - 처음 나온 hit를 유지 (쿼리 순서 = 우선순위)
+    seen = set()
+    unique_hits = []
+    for h in hits:
+        key = (h.get("absolute_url") or h.get("url") or "", h.get("caseName") or h.get("title") or "")
+        if key not in seen:
+            seen.add(key)
+            unique_hits.append(h)
+    hits = unique_hits
+
+    cl_docs = build_complaint_documents_from_hits(hits, days=lookback_days)
+    # RECAP 도켓(사건) 요약: "법원 사건(도켓) 확인 건수"로 사용
+    cl_cases = build_case_summaries_from_hits(hits)
+    return cl_docs, cl_cases
+
+
+def _collect_news_lawsuits(lookback_days: int) -> list:
+    """뉴스 수집 → 알려진 사건 보강 → 소송 목록."""
+    news = fetch_news()
+    known = load_known_cases()
+    return build_lawsuits_from_news(news, known, lookback_days=lookback_days)
+
+
+def _find_issue_with_comments(owner: str, repo: str, gh_token: str, issue_title: str, issue_label: str) -> tuple[Optional[int], list]:
+    """오늘 이슈를 (만들지 않고) 찾아 baseline 비교용 기존 댓글을 함께 가져온다. 없으면 (None, [])."""
+    issue_no = find_open_issue(owner, repo, gh_token, issue_title, issue_label)
+    if issue_no is None:
+        return None, []
+    return issue_no, list_comments(owner, repo, gh_token, issue_no)
+
+
 def main() -> None:
     # 0) 환경 변수 로드
     owner = os.environ.get("GITHUB_OWNER")
@@ -38,7 +88,7 @@ def main() -> None:
     # 필요 시 2로 변경: 환경변수 LOOKBACK_DAYS=2
     
     # KST 기준 날짜 생성
-    now_kst = datetime.now(ZoneInfo("Asia/Seoul"))
+    now_kst = datetime.now(_KST)
     run_ts_kst = now_kst.strftime("%Y-%m-%d %H:%M")
     issue_day_kst = now_kst.strftime("%Y-%m-%d")
     issue_title = f"{base_title} ({issue_day_kst})"
@@ -46,46 +96,37 @@ def main() -> None:
     
     issue_label = os.environ.get("ISSUE_LABEL", "ai-lawsuit-monitor")
 
-    # 1) CourtListener 검색
-    hits = []
-    for q in COURTLISTENER_QUERIES:
-        debug_log(f"Running CourtListener query: {q}")
-        hits.extend(search_recent_documents(q, days=lookback_days, max_results=20))
-    
-    # 중복 제거
-    dedup = {}
-    for h in hits:
-        key = (h.get("absolute_url") or h.get("url") or "") + "|" + (h.get("caseName") or h.get("title") or "")
-        dedup[key] = h
-    hits = list(dedup.values())
-
-    cl_docs = build_complaint_documents_from_hits(hits, days=lookback_days)
-    # RECAP 도켓(사건) 요약: "법원 사건(도켓) 확인 건수"로 사용
-    cl_cases = build_case_summaries_from_hits(hits)
-
-    # 2) 뉴스 수집
-    news = fetch_news()
-    known = load_known_cases()
-    lawsuits = build_lawsuits_from_news(news, known, lookback_days=lookback_days)
+    # 1) 서로 독립적인 I/O 단계(CourtListener 검색, 뉴스 수집, 이슈 조회)를 동시에 실행하고
+    #    이후 병합/확장 단계는 결과가 모두 모인 뒤 순서대로 처리
+    #    (이슈 조회는 읽기 전용: 수집이 실패하면 빈 이슈가 만들어지지 않도록 생성은 렌더링 후에)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_cl = ex.submit(_collect_courtlistener, lookback_days)
+        f_news = ex.submit(_collect_news_lawsuits, lookback_days)
+        f_issue = ex.submit(_find_issue_with_comments, owner, repo, gh_token, issue_title, issue_label)
+        cl_docs, cl_cases = f_cl.result()
+        lawsuits = f_news.result()
+        issue_no, comments = f_issue.result()
 
     # 2-1) 뉴스 테이블의 소송번호(도켓번호)로 RECAP 도켓/문서 확장
     docket_numbers = [s.case_number for s in lawsuits if (s.case_number or "").strip() and s.case_number != "미확인"]
-    extra_cases = build_case_summaries_from_docket_numbers(docket_numbers)
 
     # 2-2) 소송번호가 없더라도, '소송제목'(추정 케이스명)으로 도켓 확장
     case_titles = [s.case_title for s in lawsuits if (s.case_title or "").strip() and s.case_title != "미확인"]
-    extra_cases_by_title = build_case_summaries_from_case_titles(case_titles)
 
-    merged_cases = {c.docket_id: c for c in (cl_cases + extra_cases + extra_cases_by_title)}
+    # 2-1/2-2는 서로 독립적인 조회이므로 동시에 실행 (문서 조회는 병합된 도켓 id가 필요해 그 뒤에)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_by_number = ex.submit(build_case_summaries_from_docket_numbers, docket_numbers)
+        f_by_title = ex.submit(build_case_summaries_from_case_titles, case_titles)
+        extra_cases = f_by_number.result()
+        extra_cases_by_title = f_by_title.result()
+
+    merged_cases = {c.docket_id: c for c in chain(cl_cases, extra_cases, extra_cases_by_title)}
     cl_cases = list(merged_cases.values())
 
     # 문서도 docket id 기반으로 추가 시도(Complaint 우선, 없으면 fallback)
     docket_ids = list(merged_cases.keys())
     extra_docs = build_documents_from_docket_ids(docket_ids, days=lookback_days)
-    merged_docs = {}
-    for d in (cl_docs + extra_docs):
-        key = (d.docket_id, d.doc_number, d.date_filed, d.document_url)
-        merged_docs[key] = d
+    merged_docs = {(d.docket_id, d.doc_number, d.date_filed, d.document_url): d for d in chain(cl_docs, extra_docs)}
     cl_docs = list(merged_docs.values())
 
     docket_case_count = len(cl_cases)
@@ -94,13 +135,8 @@ def main() -> None:
     # FIX: RECAP 문서 건수 계산 방식 수정
     # 해결: cl_docs에 있는 것 + cl_cases 중 complaint_link가 있는 Docket ID 합산
     # =====================================================
-    unique_dockets_with_docs = set()
-    for d in cl_docs:
-        if d.docket_id:
-            unique_dockets_with_docs.add(d.docket_id)
-    for c in cl_cases:
-        if c.complaint_link and c.docket_id:
-            unique_dockets_with_docs.add(c.docket_id)
+    unique_dockets_with_docs = {d.docket_id for d in cl_docs if d.docket_id}
+    unique_dockets_with_docs.update(c.docket_id for c in cl_cases if c.complaint_link and c.docket_id)
     
     recap_doc_count = len(unique_dockets_with_docs)
 
@@ -112,16 +148,17 @@ def main() -> None:
         recap_doc_count,
         lookback_days=lookback_days,
     )    
-    # 4) GitHub Issue 작업
-    issue_no = find_or_create_issue(owner, repo, gh_token, issue_title, issue_label)
+    # 4) GitHub Issue 작업 (기존 이슈 번호/댓글은 1단계에서 함께 조회, 없을 때만 여기서 생성)
+    if issue_no is None:
+        issue_no = find_or_create_issue(owner, repo, gh_token, issue_title, issue_label)
+        comments = list_comments(owner, repo, gh_token, issue_no)
     issue_url = f"https://github.com/{owner}/{repo}/issues/{issue_no}"
    
 
     # =========================================================
     # Baseline 비교 로직 (Modularized)
     # =========================================================
-    comments = list_comments(owner, repo, gh_token, issue_no)
-    md = apply_deduplication(md, comments)
+    md, dedup_stats = apply_deduplication(md, comments)
     
     # 실행 시각(KST)을 최상단에 배치 (중복 제거 요약보다 위에 오도록)
     md = f"### 실행 시각(KST): {run_ts_kst}\n\n" + md
@@ -136,14 +173,14 @@ def main() -> None:
     debug_log(f"  └ Cases (CourtListener+RECAP): {docket_case_count}건 (문서 {recap_doc_count}건)")
 
     debug_log("===== REPORT PREVIEW (First 1000 chars) =====")
-    debug_log(md[:1000])
-    debug_log(f"Report full length: {len(md)}")
+    # 비활성 시 슬라이스/포맷 없이 바로 반환되도록 lazy 인자로 전달
+    debug_log("%.1000s", md)
+    debug_log("Report full length: %d", len(md))
 
-    # KST 기준 타임스탬프
-    timestamp = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d %H:%M KST")
+    # KST 기준 타임스탬프 (실행 시각과 같은 시점)
+    timestamp = now_kst.strftime("%Y-%m-%d %H:%M KST")
 
-    comment_body = f"\n\n{md}"
-    create_comment(owner, repo, gh_token, issue_no, comment_body)
+    create_comment(owner, repo, gh_token, issue_no, "\n\n" + md)
     debug_log(f"Issue #{issue_no} 댓글 업로드 완료")
 
     # 5) Slack 요약 전송
@@ -151,83 +188,42 @@ def main() -> None:
     # Slack 출력 개선 (최종 포맷)
     # ============================================
 
-    slack_dedup_news = None
-    slack_dedup_cases = None
-
-    if "### 중복 제거 요약:" in md:
-        m_news = re.search(
-            r"└ News (.+)",
-            md,
-        )
-
-        m_cases = re.search(
-            r"└ Cases (.+)",
-            md,
-        )
-
-        if m_news:
-            line = m_news.group(1).strip()
-            # GitHub용 강조(**)와 🔴 제거 (Slack용으로 재구성하기 위함)
-            line = line.replace("**", "").replace(" 🔴", "")
-            # New 수치가 0보다 크면 강조 (Bolding + 🔴)
-            slack_dedup_news = re.sub(
-                r"(\d+)\s+\(New\)",
-                lambda m: f"*{m.group(1)} (New)*" + (" :red_circle:" if int(m.group(1)) > 0 else ""),
-                line
-            )
-
-        if m_cases:
-            line = m_cases.group(1).strip()
-            # GitHub용 강조(**)와 🔴 제거
-            line = line.replace("**", "").replace(" 🔴", "")
-            slack_dedup_cases = re.sub(
-                r"(\d+)\s+\(New\)",
-                lambda m: f"*{m.group(1)} (New)*" + (" :red_circle:" if int(m.group(1)) > 0 else ""),
-                line
-            )
-
-
-
-    slack_lines = []
-
-    slack_lines.append(":bar_chart: AI 소송 모니터링")
-    slack_lines.append(f"🕒 {timestamp}")
-    slack_lines.append("")
-
-    # 🔁 Dedup Summary
-    if slack_dedup_news and slack_dedup_cases:
-        slack_lines.append(":arrows_counterclockwise: Dedup Summary")
-        slack_lines.append(f"└ News {slack_dedup_news}")
-        slack_lines.append(f"└ Cases {slack_dedup_cases}")
-        slack_lines.append("")
+    buf = io.StringIO()
+    write = buf.write
+
+    write(":bar_chart: AI 소송 모니터링\n")
+    write(f"🕒 {timestamp}\n\n")
+
+    # 🔁 Dedup Summary (apply_deduplication이 계산한 수치를 그대로 사용)
+    if dedup_stats:
+        st = dedup_stats
+        write(":arrows_counterclockwise: Dedup Summary\n")
+        write(f"└ News {_slack_dedup_line(st.base_news, st.dup_news, st.new_news)}\n")
+        write(f"└ Cases {_slack_dedup_line(st.base_cases, st.dup_cases, st.new_cases)}\n\n")
 
     # 📈 Collection Status
-    slack_lines.append(":chart_with_upwards_trend: Collection Status")
-    slack_lines.append(f"└ News: {len(lawsuits)}")
-    slack_lines.append(
-        f"└ Cases: {docket_case_count} (Docs: {recap_doc_count})"
-    )
-    slack_lines.append("")
+    write(":chart_with_upwards_trend: Collection Status\n")
+    write(f"└ News: {len(lawsuits)}\n")
+    write(f"└ Cases: {docket_case_count} (Docs: {recap_doc_count})\n\n")
 
-    # 🔗 GitHub
-    slack_lines.append(f":link: GitHub: <{issue_url}|#{issue_no}>")
+    # 🔗 GitHub (마지막 줄에는 개행을 붙이지 않음)
+    write(f":link: GitHub: <{issue_url}|#{issue_no}>")
 
     # 🆕 최신 RECAP 문서 (820 Copyright) - Top 3
-    copyright_cases = []
-    for c in cl_cases:
-        nos = str(c.nature_of_suit or "").strip()
-        if "820" in nos or "copyright" in nos.lower():
-            copyright_cases.append(c)
-
-    top_cases = sorted(
+    # 820/Copyright 판정과 Top 3 선택을 한 번의 순회로 처리 (중간 목록 없이 힙에 바로 공급)
+    # 3건만 필요하므로 전체 정렬 대신 크기 3 힙으로 선택 (sorted(..., reverse=True)[:3]과 동일 결과)
+    copyright_cases = (
+        c for c in cl_cases
+        if "820" in (nos := c.nature_of_suit or "") or "copyright" in nos.lower()
+    )
+    top_cases = heapq.nlargest(
+        3,
         copyright_cases,
         key=lambda x: x.recent_updates if x.recent_updates != "미확인" else "",
-        reverse=True
-    )[:3]
+    )
 
     if top_cases:
-        slack_lines.append("")
-        slack_lines.append(":new: 최신 RECAP 문서 (820 Copyright)")
+        write("\n\n:new: 최신 RECAP 문서 (820 Copyright)")
 
         for c in top_cases:
             date = c.recent_updates if c.recent_updates != "미확인" else "N/A"
@@ -236,9 +232,9 @@ def main() -> None:
             slug = slugify_case_name(name)
             docket_url = f"https://www.courtlistener.com/docket/{c.docket_id}/{slug}/"
             
-            slack_lines.append(f"• {date} | <{docket_url}|{name}>")
+            write(f"\n• {date} | <{docket_url}|{name}>")
     try:
-        post_to_slack(slack_webhook, "\n".join(slack_lines))
+        post_to_slack(slack_webhook, buf.getvalue())
         debug_log(f"Slack 전송 완료")
     except Exception as e:
         debug_log(f"Slack 전송 실패: {e}")
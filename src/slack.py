@@ -1,6 +1,9 @@
 from __future__ import annotations
 import requests
 
+# 웹훅 호스트와의 연결(TCP/TLS)을 재사용하도록 세션을 모듈 단위로 유지
+_SESSION = requests.Session()
+
 def post_to_slack(webhook_url: str, text: str) -> None:
-    r = requests.post(webhook_url, json={"text": text}, timeout=20)
+    r = _SESSION.post(webhook_url, json={"text": text}, timeout=20)
     r.raise_for_status()
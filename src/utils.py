@@ -1,20 +1,33 @@
 import os
 import re
+from functools import lru_cache
 
-def debug_log(msg: str):
+def debug_enabled() -> bool:
+    """DEBUG 환경 변수가 '1'인지 확인합니다. (실행 중 토글될 수 있으므로 매번 읽음)"""
+    return os.environ.get("DEBUG") == "1"
+
+def debug_log(msg: str, *args):
     """
     DEBUG 환경 변수가 '1'일 때만 메세지를 출력합니다.
+    args가 주어지면 출력할 때만 msg % args로 포맷합니다 (비활성 시 포맷 비용 없음).
     """
-    if os.environ.get("DEBUG") == "1":
-        print(f"[DEBUG] {msg}")
+    if debug_enabled():
+        print(f"[DEBUG] {msg % args if args else msg}")
+
+# slug 변환용 패턴 (케이스마다 호출되므로 미리 컴파일)
+_RE_NONSLUG = re.compile(r"[^a-z0-9\s-]")
+_RE_WS = re.compile(r"\s+")
+_RE_DASH = re.compile(r"-+")
 
+# 같은 사건명이 뉴스/제목/번호 확장 경로와 Slack 요약에서 반복되므로 결과를 실행 동안 재사용
+@lru_cache(maxsize=2048)
 def slugify_case_name(name: str) -> str:
     """
     Case name을 URL에 적합한 slug 형태로 변환합니다.
     """
     name = (name or "").lower()
     name = name.replace("v.", "v")
-    name = re.sub(r"[^a-z0-9\s-]", "", name)
-    name = re.sub(r"\s+", "-", name)
-    name = re.sub(r"-+", "-", name)
+    name = _RE_NONSLUG.sub("", name)
+    name = _RE_WS.sub("-", name)
+    name = _RE_DASH.sub("-", name)
     return name.strip("-")
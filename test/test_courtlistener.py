@@ -0,0 +1,170 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# HTTP 캐시(sqlite)가 작업 트리의 .cache를 건드리지 않도록 import 전에 임시 디렉터리로 돌린다
+os.environ.setdefault("CL_CACHE_DIR", tempfile.mkdtemp(prefix="cl-test-"))
+
+from src import courtlistener as cl
+
+DOCKET = {"case_name": "Doe v. AI Corp", "docket_number": "1:26-cv-1", "court": "cand", "date_filed": "2026-01-02"}
+HTML_PDF = "https://storage.courtlistener.com/recap/gov.uscourts.cand.1/gov.uscourts.cand.1.1.0.pdf"
+
+
+@pytest.fixture
+def fallback(monkeypatch):
+    """네트워크 호출을 막고 HTML fallback 호출 여부를 기록한다."""
+    calls = {"html": [], "presence": []}
+
+    def fake_html(docket_id):
+        calls["html"].append(docket_id)
+        return HTML_PDF
+
+    def fake_presence(docket_id):
+        calls["presence"].append(docket_id)
+        return calls.get("has_recap", False)
+
+    monkeypatch.setattr(cl, "_get", lambda url, params=None: dict(DOCKET))
+    monkeypatch.setattr(cl, "_fetch_recap_docs", lambda docket_id: ())
+    monkeypatch.setattr(cl, "_extract_first_pdf_from_docket_html", fake_html)
+    monkeypatch.setattr(cl, "_docket_has_recap_docs", fake_presence)
+    monkeypatch.setattr(cl, "extract_pdf_text", lambda url, max_chars=6000: "")
+    monkeypatch.setattr(cl, "_recap_pdf_snippet", lambda url: "")
+    return calls
+
+
+# =====================================================
+# _complaint_documents_for_hit: HTML fallback gating
+# =====================================================
+
+def test_fallback_when_docket_has_no_recap_docs(fallback):
+    out = cl._complaint_documents_for_hit({"docket_id": 11}, "2026-01-01")
+    assert fallback["presence"] == [11]
+    assert fallback["html"] == [11]
+    assert [(d.doc_type, d.pdf_url, d.case_name) for d in out] == [
+        ("Complaint (HTML Fallback)", HTML_PDF, "Doe v. AI Corp"),
+    ]
+
+
+def test_no_fallback_when_only_non_complaint_recap_docs(fallback):
+    # 소장 후보가 없어도 도켓에 다른 RECAP 문서가 있으면 HTML을 긁지 않는다
+    fallback["has_recap"] = True
+    out = cl._complaint_documents_for_hit({"docket_id": 12}, "2026-01-01")
+    assert fallback["presence"] == [12]
+    assert fallback["html"] == []
+    assert out == []
+
+
+def test_no_fallback_when_complaint_candidates_exist(fallback, monkeypatch):
+    doc = {
+        "description": "COMPLAINT against AI Corp",
+        "date_filed": "2026-01-03",
+        "document_number": "1",
+        "filepath_local": "recap/gov.uscourts.cand.1/1.pdf",
+    }
+    monkeypatch.setattr(cl, "_fetch_recap_docs", lambda docket_id: (doc,))
+    out = cl._complaint_documents_for_hit({"docket_id": 13}, "2026-01-01")
+    assert fallback["presence"] == []
+    assert fallback["html"] == []
+    assert [d.doc_type for d in out] == ["Complaint"]
+
+
+# =====================================================
+# _docket_has_recap_docs
+# =====================================================
+
+def test_docket_has_recap_docs_caches_only_successful_answers(monkeypatch):
+    responses = [None, {"count": 3, "results": [{"id": 1}]}]
+    seen = []
+
+    def fake_get(url, params=None):
+        seen.append(params)
+        return responses.pop(0)
+
+    monkeypatch.setattr(cl, "_get", fake_get)
+    monkeypatch.setattr(cl, "_recap_presence", {})
+    assert cl._docket_has_recap_docs(21) is False  # 조회 실패는 캐시하지 않는다
+    assert cl._docket_has_recap_docs(21) is True
+    assert cl._docket_has_recap_docs(21) is True
+    assert seen == [{"docket": 21, "page_size": 1}] * 2
+
+
+# =====================================================
+# _iter_recap_pages: description filter verification
+# =====================================================
+
+def test_iter_recap_pages_rejects_ignored_description_filter(monkeypatch):
+    # django-filter가 모르는 필터를 무시하면 용어와 무관한 문서가 섞여 온다
+    page = {"count": 2, "next": None, "results": [{"description": "Complaint"}, {"description": "Summons"}]}
+    monkeypatch.setattr(cl, "_get", lambda url, params=None: page)
+    with pytest.raises(cl._FilterRejected):
+        list(cl._iter_recap_pages(31, description="complaint"))
+
+
+def test_iter_recap_pages_accepts_matching_description_filter(monkeypatch):
+    page = {"count": 1, "next": None, "results": [{"description": "Amended COMPLAINT"}]}
+    monkeypatch.setattr(cl, "_get", lambda url, params=None: page)
+    assert list(cl._iter_recap_pages(32, description="complaint")) == [page["results"]]
+
+
+# =====================================================
+# _iter_complaint_recap_pages: listing order across filter terms
+# =====================================================
+
+def test_complaint_pages_merge_terms_in_docket_order(monkeypatch):
+    # "complaint" 결과가 먼저 오더라도 먼저 등재된 Petition이 첫 후보가 되어야 한다
+    by_term = {
+        "complaint": [{"id": 3, "document_number": "12", "description": "Amended Complaint"}],
+        "petition": [
+            {"id": 1, "document_number": "1", "description": "Petition to Compel"},
+            {"id": 3, "document_number": "12", "description": "Amended Complaint and Petition"},
+        ],
+    }
+
+    def fake_get(url, params=None):
+        return {"count": 0, "next": None, "results": by_term[params["description__icontains"]]}
+
+    monkeypatch.setattr(cl, "_get", fake_get)
+    pages = list(cl._iter_complaint_recap_pages(41))
+    assert [[d["id"] for d in page] for page in pages] == [[1, 3]]
+
+
+# =====================================================
+# _iter_recap_docs / _first_complaint_doc: failed walks are not cached
+# =====================================================
+
+def test_failed_recap_walk_is_not_cached(monkeypatch):
+    doc = {"id": 7, "document_number": "1", "description": "Complaint for Damages"}
+    pages = {
+        None: {"count": None, "next": "NEXT", "results": [doc]},
+        "NEXT": None,  # 두 번째 페이지 요청 실패
+    }
+
+    def fake_get(url, params=None):
+        return pages[None] if params else pages["NEXT"]
+
+    monkeypatch.setattr(cl, "_get", fake_get)
+    monkeypatch.setattr(cl, "_recap_docs_cache", {})
+    cl._fetch_recap_docs(51)
+    assert 51 not in cl._recap_docs_cache
+
+    # 다음 조회가 끝까지 성공하면 그때 캐시된다
+    pages["NEXT"] = {"count": None, "next": None, "results": []}
+    assert cl._fetch_recap_docs(51) == (doc,)
+    assert cl._recap_docs_cache[51] == (doc,)
+
+
+def test_first_complaint_doc_does_not_memoize_misses(monkeypatch):
+    responses = [None, None, {"count": 1, "next": None, "results": [{"id": 8, "description": "Complaint"}]}]
+    monkeypatch.setattr(cl, "_get", lambda url, params=None: responses.pop(0) if len(responses) > 1 else responses[0])
+    monkeypatch.setattr(cl, "_recap_docs_cache", {})
+    cl._first_complaint_doc_cached.cache_clear()
+    # 첫 호출: 필터 요청과 전체 조회가 모두 실패 → None이지만 기억하지 않는다
+    assert cl._first_complaint_doc(52) is None
+    assert cl._first_complaint_doc(52)["id"] == 8
+    assert cl._first_complaint_doc_cached.cache_info().currsize == 1
@@ -0,0 +1,144 @@
+import dataclasses
+import os
+import sys
+
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.dedup import (
+    DedupStats,
+    _index_comment,
+    _parse_table_cached,
+    _split_row,
+    apply_deduplication,
+    parse_table,
+)
+
+NEWS_HEADER = "| No. | 기사일자 | 제목 | 위험도⬇️ |"
+NEWS_SEP = "|---|---|---|---|"
+CASES_HEADER = "| No. | 상태 | 케이스명 | 도켓번호 | 위험도⬇️ |"
+CASES_SEP = "|---|---|---|---|---|"
+
+
+def _news_row(no: int, url: str) -> str:
+    return f"| {no} | 2026-01-01 | [기사 {no}]({url}) | 🟡 40 |"
+
+
+def _case_row(no: int, docket: str) -> str:
+    return f"| {no} | 진행중 | Case {no} | {docket} | 🔴 80 |"
+
+
+def _report(news_urls, dockets) -> str:
+    lines = ["# 리포트", "", "## 📰 AI Suit News", NEWS_HEADER, NEWS_SEP]
+    lines += [_news_row(i, u) for i, u in enumerate(news_urls, 1)]
+    lines += ["", "## ⚖️ Cases", CASES_HEADER, CASES_SEP]
+    lines += [_case_row(i, d) for i, d in enumerate(dockets, 1)]
+    return "\n".join(lines) + "\n"
+
+
+# =====================================================
+# Table parsing
+# =====================================================
+
+def test_split_row_plain():
+    assert _split_row("  | a | b |c|  ") == ("a", "b", "c")
+
+
+def test_split_row_escaped_pipe():
+    # 이스케이프된 파이프는 셀 구분자가 아니다 (정규식 경로)
+    assert _split_row(r"| a \| b | c |") == (r"a \| b", "c")
+
+
+def test_parse_table_cached_returns_shared_tuples():
+    section = "\n".join([NEWS_HEADER, NEWS_SEP, _news_row(1, "https://a.example/1")])
+    first = _parse_table_cached(section)
+    assert _parse_table_cached(section) is first
+    headers, rows, meta = first
+    assert headers == ("No.", "기사일자", "제목", "위험도⬇️")
+    assert rows == (("1", "2026-01-01", "[기사 1](https://a.example/1)", "🟡 40"),)
+    assert meta == (NEWS_HEADER, NEWS_SEP)
+
+
+def test_parse_table_cached_skips_mismatched_rows_and_empty_sections():
+    section = "\n".join([NEWS_HEADER, NEWS_SEP, "| 1 | 2 |", _news_row(2, "https://a.example/2")])
+    _, rows, _ = _parse_table_cached(section)
+    assert [r[0] for r in rows] == ["2"]
+    assert _parse_table_cached("새로운 소식이 0건입니다.") == ((), (), ("", ""))
+
+
+def test_parse_table_returns_independent_lists():
+    section = "\n".join([NEWS_HEADER, NEWS_SEP, _news_row(1, "https://a.example/1")])
+    _, rows, _ = parse_table(section)
+    rows[0][0] = "99"
+    # 호출자의 수정이 캐시된 결과에 새지 않아야 한다
+    _, again, _ = parse_table(section)
+    assert again[0][0] == "1"
+    assert _parse_table_cached(section)[1][0][0] == "1"
+
+
+# =====================================================
+# Comment index
+# =====================================================
+
+def test_index_comment_extracts_urls_and_dockets():
+    body = _report(["https://a.example/1&hl=en", "https://a.example/2"], ["1:24-cv-1"])
+    articles, dockets = _index_comment(body)
+    assert articles == {"https://a.example/1", "https://a.example/2"}
+    assert dockets == {"1:24-cv-1"}
+
+
+def test_index_comment_is_cached_per_body():
+    body = _report(["https://cache.example/1"], ["9:26-cv-9"])
+    _index_comment.cache_clear()
+    first = _index_comment(body)
+    assert _index_comment(body) is first
+    assert _index_comment.cache_info().hits == 1
+    # 본문이 바뀌면 새로 인덱싱된다
+    changed = _index_comment(_report(["https://cache.example/2"], ["9:26-cv-9"]))
+    assert changed[0] == {"https://cache.example/2"}
+    assert _index_comment.cache_info().misses == 2
+
+
+# =====================================================
+# apply_deduplication
+# =====================================================
+
+def test_apply_deduplication_without_comments():
+    md = _report(["https://a.example/1"], ["1:24-cv-1"])
+    assert apply_deduplication(md, []) == (md, None)
+
+
+def test_apply_deduplication_skips_and_renumbers():
+    previous = _report(["https://a.example/1"], ["1:24-cv-1", "1:24-cv-2"])
+    md = _report(
+        ["https://a.example/1", "https://a.example/2", "https://a.example/3"],
+        ["1:24-cv-2", "1:24-cv-3"],
+    )
+    out, stats = apply_deduplication(md, [{"body": previous}, {"body": None}])
+
+    assert stats == DedupStats(base_news=1, dup_news=1, new_news=2, base_cases=2, dup_cases=1, new_cases=1)
+    assert out.startswith("### 중복 제거 요약:\n")
+    assert "└ News 1 (Baseline): 1 (Dup), **2 (New)** 🔴" in out
+    assert "└ Cases 2 (Baseline): 1 (Dup), **1 (New)** 🔴" in out
+    assert "https://a.example/1)" not in out
+    assert "| 1 | 2026-01-01 | [기사 2](https://a.example/2) | 🟡 40 |" in out
+    assert "| 2 | 2026-01-01 | [기사 3](https://a.example/3) | 🟡 40 |" in out
+    assert "| 1 | 진행중 | Case 2 | 1:24-cv-3 | 🔴 80 |" in out
+    assert "1:24-cv-2 |" not in out
+
+
+def test_apply_deduplication_all_duplicates():
+    md = _report(["https://a.example/1"], ["1:24-cv-1"])
+    out, stats = apply_deduplication(md, [{"body": md}])
+    assert (stats.new_news, stats.new_cases) == (0, 0)
+    assert out.count("새로운 소식이 0건입니다.") == 2
+    assert NEWS_HEADER not in out and CASES_HEADER not in out
+    assert "**0 (New)**\n" in out
+
+
+def test_dedup_stats_is_frozen():
+    stats = DedupStats(1, 2, 3, 4, 5, 6)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        stats.new_news = 0